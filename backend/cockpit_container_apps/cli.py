@@ -33,7 +33,7 @@ from cockpit_container_apps.commands import (
     remove,
     set_config,
 )
-from cockpit_container_apps.utils.formatters import to_json
+from cockpit_container_apps.utils.formatters import to_json_bytes
 from cockpit_container_apps.vendor.cockpit_apt_utils.errors import APTBridgeError, format_error
 
 
@@ -313,7 +313,11 @@ def main() -> NoReturn:
         # Output result as JSON to stdout (if not None)
         # Commands that stream progress may print results themselves and return None
         if result is not None:
-            print(to_json(result))
+            # Written as bytes so large package lists are not decoded and
+            # re-encoded on the way out
+            sys.stdout.flush()
+            sys.stdout.buffer.write(to_json_bytes(result))
+            sys.stdout.buffer.write(b"\n")
         sys.exit(0)
 
     except APTBridgeError as e:
@@ -12,7 +12,7 @@ from cockpit_container_apps.utils.store_filter import (
     get_pre_filtered_packages,
     matches_store_filter,
 )
-from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import get_tags_by_facet
+from cockpit_container_apps.utils.tag_cache import get_facet_values
 from cockpit_container_apps.vendor.cockpit_apt_utils.errors import CacheError
 from cockpit_container_apps.vendor.cockpit_apt_utils.repository_parser import (
     package_matches_repository,
@@ -87,35 +87,38 @@ def execute(
         applied_filters = []
 
         # Optimization: Use pre-filtered packages if store is specified
-        packages_to_check = get_pre_filtered_packages(cache, store) if store else list(cache)
+        packages_to_check = get_pre_filtered_packages(cache, store) if store else cache
+        query_lower = search_query.lower() if search_query else ""
 
         for pkg in packages_to_check:
-            if not pkg.candidate:
+            # Candidate is a computed property on apt.Package; read it once
+            candidate = pkg.candidate
+            if not candidate:
                 continue
 
             # Apply full store filter (pre-filtering is just an optimization)
             if store and not matches_store_filter(pkg, store):
                 continue
 
+            # Installed state is cheap to read, so the tab filter runs before the
+            # repository and category checks, which read origins and tag records
+            if tab == "installed" and not pkg.is_installed:
+                continue
+            if tab == "upgradable" and not pkg.is_upgradable:
+                continue
+
             if repository_id and not package_matches_repository(pkg, repository_id):
                 continue
 
             if category_id:
-                categories = get_tags_by_facet(pkg, "category")
+                categories = get_facet_values(pkg, "category")
                 if category_id not in categories:
                     continue
 
-            if tab == "installed" and not pkg.is_installed:
-                continue
-            if tab == "upgradable" and not pkg.is_upgradable:
-                continue
-
-            if search_query:
-                query_lower = search_query.lower()
+            if query_lower:
                 name_match = query_lower in pkg.name.lower()
-                summary_match = (
-                    pkg.candidate.summary and query_lower in pkg.candidate.summary.lower()
-                )
+                summary = candidate.summary
+                summary_match = summary and query_lower in summary.lower()
                 if not (name_match or summary_match):
                     continue
 
@@ -12,6 +12,7 @@ import yaml
 from cockpit_container_apps.utils.config_utils import (
     _validate_package_name,
     get_config_schema_path,
+    load_config_schema,
 )
 
 logger = logging.getLogger(__name__)
@@ -46,8 +47,7 @@ def execute(package: str) -> dict[str, Any]:
 
         # Read and parse YAML
         try:
-            with schema_path.open("r") as f:
-                schema = yaml.safe_load(f)
+            schema = load_config_schema(schema_path)
         except yaml.YAMLError as e:
             return {
                 "success": False,
@@ -14,10 +14,7 @@ from cockpit_container_apps.utils.store_filter import (
     get_pre_filtered_packages,
     matches_store_filter,
 )
-from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import (
-    derive_category_label,
-    get_tags_by_facet,
-)
+from cockpit_container_apps.utils.tag_cache import category_label
 from cockpit_container_apps.vendor.cockpit_apt_utils.errors import APTBridgeError, CacheError
 
 
@@ -68,16 +65,14 @@ def execute(store_id: str) -> dict[str, Any]:
     try:
         # Load store configuration
         stores = load_stores()
-        matching_stores = [s for s in stores if s.id == store_id]
+        store_config = next((s for s in stores if s.id == store_id), None)
 
-        if not matching_stores:
+        if store_config is None:
             raise APTBridgeError(
                 f"Store '{store_id}' not found",
                 "STORE_NOT_FOUND",
             )
 
-        store_config = matching_stores[0]
-
         # Build metadata lookup map for categories
         category_metadata_map = {}
         if store_config.category_metadata:
@@ -88,90 +83,58 @@ def execute(store_id: str) -> dict[str, Any]:
 
         # Collect packages and category counts in single pass
         packages = []
-        category_counts_all: dict[str, int] = {}
-        category_counts_available: dict[str, int] = {}
-        category_counts_installed: dict[str, int] = {}
+        # Each row holds [all, available, installed] for one category ID
+        category_counts: dict[str, list[int]] = {}
 
         for pkg in packages_to_check:
-            # Apply store filter
-            if not matches_store_filter(pkg, store_config):
+            # Only process packages with candidate version; checked first since
+            # the store filter needs the candidate anyway
+            if not pkg.candidate:
                 continue
 
-            # Only process packages with candidate version
-            if not pkg.candidate:
+            # Apply store filter
+            if not matches_store_filter(pkg, store_config):
                 continue
 
             # Add to packages list
-            packages.append(format_package(pkg))
-
-            # Extract category tags for counting
-            categories = get_tags_by_facet(pkg, "category")
-
-            # Count for all packages
+            package = format_package(pkg)
+            packages.append(package)
+
+            # Count the formatted categories (no second tag or installed-state
+            # lookup), for all packages and for either installed or available.
+            # A category repeated in the Tag field is listed, and counted, once.
+            categories = package["categories"]
+            state = 2 if package["installed"] else 1
             for category_id in categories:
-                category_counts_all[category_id] = category_counts_all.get(category_id, 0) + 1
-
-            # Count for available (not installed) packages
-            if not pkg.is_installed:
-                for category_id in categories:
-                    category_counts_available[category_id] = (
-                        category_counts_available.get(category_id, 0) + 1
-                    )
-
-            # Count for installed packages
-            if pkg.is_installed:
-                for category_id in categories:
-                    category_counts_installed[category_id] = (
-                        category_counts_installed.get(category_id, 0) + 1
-                    )
+                row = category_counts.get(category_id)
+                if row is None:
+                    row = category_counts[category_id] = [0, 0, 0]
+                row[0] += 1
+                row[state] += 1
 
         # Build category list with metadata
         categories_list = []
 
-        # Get all unique category IDs
-        all_category_ids = (
-            set(category_counts_all.keys())
-            | set(category_counts_available.keys())
-            | set(category_counts_installed.keys())
-        )
-
-        for category_id in all_category_ids:
-            # Check if we have metadata for this category
+        for category_id, (count_all, count_available, count_installed) in category_counts.items():
+            # Use metadata from store config, or auto-derive the label from the ID
             metadata = category_metadata_map.get(category_id)
-
-            # Get counts for all three states
-            count_all = category_counts_all.get(category_id, 0)
-            count_available = category_counts_available.get(category_id, 0)
-            count_installed = category_counts_installed.get(category_id, 0)
-
             if metadata:
-                # Use metadata from store config
-                categories_list.append(
-                    {
-                        "id": category_id,
-                        "label": metadata.label,
-                        "icon": metadata.icon,
-                        "description": metadata.description,
-                        "count": count_all,
-                        "count_all": count_all,
-                        "count_available": count_available,
-                        "count_installed": count_installed,
-                    }
-                )
+                label, icon, description = metadata.label, metadata.icon, metadata.description
             else:
-                # Auto-derive label from ID
-                categories_list.append(
-                    {
-                        "id": category_id,
-                        "label": derive_category_label(category_id),
-                        "icon": None,
-                        "description": None,
-                        "count": count_all,
-                        "count_all": count_all,
-                        "count_available": count_available,
-                        "count_installed": count_installed,
-                    }
-                )
+                label, icon, description = category_label(category_id), None, None
+
+            categories_list.append(
+                {
+                    "id": category_id,
+                    "label": label,
+                    "icon": icon,
+                    "description": description,
+                    "count": count_all,
+                    "count_all": count_all,
+                    "count_available": count_available,
+                    "count_installed": count_installed,
+                }
+            )
 
         # Sort categories alphabetically by label
         categories_list.sort(key=lambda c: c["label"])
@@ -13,9 +13,11 @@ from cockpit_container_apps.utils.store_filter import (
     get_pre_filtered_packages,
     matches_store_filter,
 )
-from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import (
-    derive_category_label,
-    get_tags_by_facet,
+from cockpit_container_apps.utils.tag_cache import (
+    category_label,
+    facet_values,
+    get_tags,
+    iter_candidate_tags,
 )
 from cockpit_container_apps.vendor.cockpit_apt_utils.errors import APTBridgeError, CacheError
 
@@ -64,111 +66,76 @@ def execute(store_id: str | None = None) -> list[dict[str, Any]]:
 
         if store_id:
             stores = load_stores()
-            matching_stores = [s for s in stores if s.id == store_id]
+            store_config = next((s for s in stores if s.id == store_id), None)
 
-            if not matching_stores:
+            if store_config is None:
                 raise APTBridgeError(
                     f"Store '{store_id}' not found",
                     "STORE_NOT_FOUND",
                 )
 
-            store_config = matching_stores[0]
-
             # Build metadata lookup map
             if store_config.category_metadata:
-                category_metadata_map = {
-                    meta.id: meta for meta in store_config.category_metadata
-                }
+                category_metadata_map = {meta.id: meta for meta in store_config.category_metadata}
 
         # Collect categories with counts for all states (all, available, installed)
         # This allows frontend to switch between states without reloading
-        category_counts_all: dict[str, int] = {}
-        category_counts_available: dict[str, int] = {}
-        category_counts_installed: dict[str, int] = {}
-
-        # Optimization: Use pre-filtered packages if store is specified
-        packages_to_check = (
-            get_pre_filtered_packages(cache, store_config)
-            if store_config
-            else list(cache)
-        )
-
-        for pkg in packages_to_check:
-            # Apply full store filter (pre-filtering is just an optimization)
-            if store_config and not matches_store_filter(pkg, store_config):
-                continue
-
-            # Only count packages with candidate version
-            if not pkg.candidate:
-                continue
-
+        # Each row holds [all, available, installed] for one category ID
+        category_counts: dict[str, list[int]] = {}
+
+        # Only count packages with candidate version
+        if store_config:
+            # Optimization: Use pre-filtered packages, then apply the full
+            # store filter (pre-filtering is just an optimization)
+            candidates = (
+                (pkg.is_installed, get_tags(pkg))
+                for pkg in get_pre_filtered_packages(cache, store_config)
+                if matches_store_filter(pkg, store_config) and pkg.candidate
+            )
+        else:
+            # Every package is counted, so read candidate tags straight from
+            # the apt_pkg cache instead of wrapping each package
+            candidates = (
+                (installed, tags) for _name, installed, tags in iter_candidate_tags(cache)
+            )
+
+        for installed, tags in candidates:
             # Extract category tags
-            categories = get_tags_by_facet(pkg, "category")
+            categories = facet_values(tags, "category")
 
-            # Count for all packages
+            # Count for all packages, and for either installed or available
+            state = 2 if installed else 1
             for category_id in categories:
-                category_counts_all[category_id] = category_counts_all.get(category_id, 0) + 1
-
-            # Count for available (not installed) packages
-            if not pkg.is_installed:
-                for category_id in categories:
-                    category_counts_available[category_id] = (
-                        category_counts_available.get(category_id, 0) + 1
-                    )
-
-            # Count for installed packages
-            if pkg.is_installed:
-                for category_id in categories:
-                    category_counts_installed[category_id] = (
-                        category_counts_installed.get(category_id, 0) + 1
-                    )
+                row = category_counts.get(category_id)
+                if row is None:
+                    row = category_counts[category_id] = [0, 0, 0]
+                row[0] += 1
+                row[state] += 1
 
         # Build category list with metadata including ALL count states
         # This allows frontend to switch between filters without reloading
         categories = []
 
-        # Get all unique category IDs from all count dictionaries
-        all_category_ids = set(category_counts_all.keys()) | \
-                          set(category_counts_available.keys()) | \
-                          set(category_counts_installed.keys())
-
-        for category_id in all_category_ids:
-            # Check if we have metadata for this category
+        for category_id, (count_all, count_available, count_installed) in category_counts.items():
+            # Use metadata from store config, or auto-derive the label from the ID
             metadata = category_metadata_map.get(category_id)
-
-            # Get counts for all three states
-            count_all = category_counts_all.get(category_id, 0)
-            count_available = category_counts_available.get(category_id, 0)
-            count_installed = category_counts_installed.get(category_id, 0)
-
             if metadata:
-                # Use metadata from store config
-                categories.append(
-                    {
-                        "id": category_id,
-                        "label": metadata.label,
-                        "icon": metadata.icon,
-                        "description": metadata.description,
-                        "count": count_all,
-                        "count_all": count_all,
-                        "count_available": count_available,
-                        "count_installed": count_installed,
-                    }
-                )
+                label, icon, description = metadata.label, metadata.icon, metadata.description
             else:
-                # Auto-derive label from ID
-                categories.append(
-                    {
-                        "id": category_id,
-                        "label": derive_category_label(category_id),
-                        "icon": None,
-                        "description": None,
-                        "count": count_all,
-                        "count_all": count_all,
-                        "count_available": count_available,
-                        "count_installed": count_installed,
-                    }
-                )
+                label, icon, description = category_label(category_id), None, None
+
+            categories.append(
+                {
+                    "id": category_id,
+                    "label": label,
+                    "icon": icon,
+                    "description": description,
+                    "count": count_all,
+                    "count_all": count_all,
+                    "count_available": count_available,
+                    "count_installed": count_installed,
+                }
+            )
 
         # Sort alphabetically by label
         categories.sort(key=lambda c: c["label"])
@@ -12,7 +12,7 @@ from cockpit_container_apps.utils.store_filter import (
     get_pre_filtered_packages,
     matches_store_filter,
 )
-from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import has_tag_facet
+from cockpit_container_apps.utils.tag_cache import get_tags, iter_candidate_tags
 from cockpit_container_apps.vendor.cockpit_apt_utils.errors import APTBridgeError, CacheError
 
 
@@ -54,33 +54,37 @@ def execute(category_id: str, store_id: str | None = None) -> list[dict[str, Any
 
         if store_id:
             stores = load_stores()
-            matching_stores = [s for s in stores if s.id == store_id]
+            store_config = next((s for s in stores if s.id == store_id), None)
 
-            if not matching_stores:
+            if store_config is None:
                 raise APTBridgeError(
                     f"Store '{store_id}' not found",
                     "STORE_NOT_FOUND",
                 )
 
-            store_config = matching_stores[0]
-
         packages = []
 
-        # Optimization: Use pre-filtered packages if store is specified
-        packages_to_check = (
-            get_pre_filtered_packages(cache, store_config) if store_config else list(cache)
-        )
-
-        for pkg in packages_to_check:
-            # Apply full store filter (pre-filtering is just an optimization)
-            if store_config and not matches_store_filter(pkg, store_config):
-                continue
-
-            if not pkg.candidate:
-                continue
-
-            if has_tag_facet(pkg, "category", category_id):
-                packages.append(format_package(pkg))
+        # Membership test against the package's tag set instead of its facet values
+        category_tag = f"category::{category_id}"
+
+        if store_config:
+            # Optimization: Use pre-filtered packages if store is specified
+            for pkg in get_pre_filtered_packages(cache, store_config):
+                # Apply full store filter (pre-filtering is just an optimization)
+                if not matches_store_filter(pkg, store_config):
+                    continue
+
+                if not pkg.candidate:
+                    continue
+
+                if category_tag in get_tags(pkg):
+                    packages.append(format_package(pkg))
+        else:
+            # Find the category's packages from the candidate tags of the whole
+            # cache, and only load those few as apt.Package objects
+            for name, _installed, tags in iter_candidate_tags(cache):
+                if category_tag in tags:
+                    packages.append(format_package(cache[name]))
 
         packages.sort(key=lambda p: p["name"])
 
@@ -8,11 +8,13 @@ by querying APT for packages with the role::container-store tag.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import apt
+from cockpit_container_apps.utils.tag_cache import get_tags
+from cockpit_container_apps.vendor.cockpit_apt_utils.errors import CacheError
 
-from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import has_tag
+if TYPE_CHECKING:
+    import apt
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +37,21 @@ def execute() -> dict[str, Any]:
         Requires store packages to have the 'role::container-store' tag
         in their debian/control file.
     """
+    try:
+        # Import apt here so CLI startup doesn't pay for loading python-apt
+        import apt  # type: ignore
+    except ImportError:
+        raise CacheError(
+            "python-apt not available - must run on Debian/Ubuntu system",
+            details="ImportError: No module named 'apt'",
+        ) from None
+
     cache = apt.Cache()
 
     store_packages: list[dict[str, Any]] = []
 
     for package in cache:
-        if has_tag(package, STORE_PACKAGE_TAG):
+        if STORE_PACKAGE_TAG in get_tags(package):
             store_packages.append(_package_to_dict(package))
 
     # Sort by package name for consistent ordering
@@ -64,12 +75,11 @@ def _package_to_dict(package: apt.Package) -> dict[str, Any]:
     version = None
     description = ""
 
-    if package.candidate:
-        version = package.candidate.version
-        description = package.candidate.summary or ""
-    elif package.installed:
-        version = package.installed.version
-        description = package.installed.summary or ""
+    # Read each version property once; apt computes them on every access
+    version_obj = package.candidate or package.installed
+    if version_obj:
+        version = version_obj.version
+        description = version_obj.summary or ""
 
     # Derive store_id from package name
     # Convention: {store_id}-container-store
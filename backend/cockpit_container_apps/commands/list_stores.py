@@ -6,7 +6,36 @@ Lists all available store configurations with metadata.
 
 from typing import Any
 
-from cockpit_container_apps.utils.store_config import load_stores
+from cockpit_container_apps.utils.store_config import StoreConfig, load_stores
+
+
+def _store_to_dict(store: StoreConfig) -> dict[str, Any]:
+    """Convert a store configuration to a JSON-serializable dictionary."""
+    return {
+        "id": store.id,
+        "name": store.name,
+        "description": store.description,
+        "icon": store.icon,
+        "banner": store.banner,
+        "filters": {
+            "include_origins": list(store.filters.include_origins),
+            "include_sections": list(store.filters.include_sections),
+            "include_tags": list(store.filters.include_tags),
+            "include_packages": list(store.filters.include_packages),
+        },
+        # Include category metadata if present
+        "category_metadata": [
+            {
+                "id": cm.id,
+                "label": cm.label,
+                "description": cm.description,
+                "icon": cm.icon,
+            }
+            for cm in store.category_metadata
+        ]
+        if store.category_metadata
+        else None,
+    }
 
 
 def execute() -> list[dict[str, Any]]:
@@ -27,39 +56,4 @@ def execute() -> list[dict[str, Any]]:
         Returns empty list if no stores are configured (vanilla mode).
         Errors loading individual stores are logged but don't fail the command.
     """
-    stores = load_stores()
-
-    # Convert StoreConfig objects to JSON-serializable dictionaries
-    result = []
-    for store in stores:
-        store_dict: dict[str, Any] = {
-            "id": store.id,
-            "name": store.name,
-            "description": store.description,
-            "icon": store.icon,
-            "banner": store.banner,
-            "filters": {
-                "include_origins": store.filters.include_origins,
-                "include_sections": store.filters.include_sections,
-                "include_tags": store.filters.include_tags,
-                "include_packages": store.filters.include_packages,
-            },
-        }
-
-        # Include category metadata if present
-        if store.category_metadata:
-            store_dict["category_metadata"] = [
-                {
-                    "id": cm.id,
-                    "label": cm.label,
-                    "description": cm.description,
-                    "icon": cm.icon,
-                }
-                for cm in store.category_metadata
-            ]
-        else:
-            store_dict["category_metadata"] = None
-
-        result.append(store_dict)
-
-    return result
+    return [_store_to_dict(store) for store in load_stores()]
@@ -14,6 +14,7 @@ from cockpit_container_apps.utils.config_utils import (
     _validate_package_name,
     get_config_file_path,
     get_config_schema_path,
+    load_config_schema,
     validate_config_value,
     write_env_file,
 )
@@ -52,8 +53,7 @@ def execute(package: str, config: dict[str, str]) -> dict[str, Any]:
 
         # Load schema
         try:
-            with schema_path.open("r") as f:
-                schema = yaml.safe_load(f)
+            schema = load_config_schema(schema_path)
         except yaml.YAMLError as e:
             return {
                 "success": False,
@@ -66,7 +66,7 @@ def execute(package: str, config: dict[str, str]) -> dict[str, Any]:
             }
 
         # Build field map from schema
-        field_map = {}
+        field_map: dict[str, dict[str, Any]] = {}
         for group in schema.get("groups", []):
             for field in group.get("fields", []):
                 field_id = field.get("id")
@@ -74,7 +74,7 @@ def execute(package: str, config: dict[str, str]) -> dict[str, Any]:
                     field_map[field_id] = field
 
         # Validate all config keys are known
-        unknown_keys = set(config.keys()) - set(field_map.keys())
+        unknown_keys = config.keys() - field_map.keys()
         if unknown_keys:
             return {
                 "success": False,
@@ -82,12 +82,10 @@ def execute(package: str, config: dict[str, str]) -> dict[str, Any]:
             }
 
         # Check all required fields are present
-        required_fields = [
-            field_id
-            for field_id, field in field_map.items()
-            if field.get("required", False)
-        ]
-        missing_required = set(required_fields) - set(config.keys())
+        required_fields = {
+            field_id for field_id, field in field_map.items() if field.get("required", False)
+        }
+        missing_required = required_fields - config.keys()
         if missing_required:
             return {
                 "success": False,
@@ -160,9 +158,7 @@ def execute(package: str, config: dict[str, str]) -> dict[str, Any]:
                 timeout=30,
             )
             if result.returncode != 0:
-                logger.warning(
-                    f"Failed to restart service {service_name}: {result.stderr}"
-                )
+                logger.warning(f"Failed to restart service {service_name}: {result.stderr}")
                 # Don't fail the config save if restart fails
                 # The config is saved, just needs manual restart
                 return {
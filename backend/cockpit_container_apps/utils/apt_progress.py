@@ -0,0 +1,95 @@
+"""apt-get progress reporting via APT::Status-Fd.
+
+Runs apt-get with its Status-Fd on a dedicated pipe and streams progress
+updates as JSON lines to stdout for the frontend. Shared by the install and
+remove commands.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import threading
+from typing import IO
+
+from cockpit_container_apps.utils.formatters import to_json_line
+
+# Status-Fd progress line: "pmstatus|dlstatus:<package>:<percent>:<message>".
+# Only the integer part of the percentage is captured; other output lines fail
+# the match on their first characters.
+_STATUS_RE = re.compile(r"\s*(?:pmstatus|dlstatus):([^:\n]*):(\d+)(?:\.\d*)?:(.*)")
+
+
+def _parse_status_line(line: str) -> tuple[int, str] | None:
+    """Parse apt-get Status-Fd output line into (percentage, message)."""
+    match = _STATUS_RE.match(line)
+    if match is None:
+        return None
+
+    package, percent_str, message = match.groups()
+    return int(percent_str), message.strip() or f"Processing {package}..."
+
+
+def _drain(stream: IO[str], chunks: list[str]) -> None:
+    """Read a stream to EOF, collecting its contents into chunks."""
+    chunks.append(stream.read())
+
+
+def run_apt_get(args: list[str]) -> tuple[int, str]:
+    """Run apt-get, streaming its progress as JSON lines to stdout.
+
+    Status-Fd is pointed at a dedicated pipe that is read line by line, while
+    stderr is drained in a background thread so a full pipe cannot stall
+    apt-get. apt-get's stdout is discarded.
+
+    Args:
+        args: apt-get arguments (e.g. ["install", "-y", "signalk-server"])
+
+    Returns:
+        Tuple of (exit code, stderr output)
+    """
+    status_read, status_write = os.pipe()
+    try:
+        process = subprocess.Popen(
+            ["apt-get", "-o", f"APT::Status-Fd={status_write}", *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            pass_fds=(status_write,),
+            text=True,
+            env={**os.environ, "DEBIAN_FRONTEND": "noninteractive"},
+        )
+    except BaseException:
+        os.close(status_read)
+        raise
+    finally:
+        os.close(status_write)
+
+    assert process.stderr is not None
+    stderr_chunks: list[str] = []
+    drain = threading.Thread(target=_drain, args=(process.stderr, stderr_chunks))
+    drain.start()
+
+    last_percentage = 0
+
+    with os.fdopen(status_read) as status_file:
+        for line in status_file:
+            progress_info = _parse_status_line(line)
+            if progress_info is None:
+                continue
+
+            percentage, message = progress_info
+            if percentage > last_percentage:
+                last_percentage = percentage
+                progress_json = {
+                    "type": "progress",
+                    "percentage": percentage,
+                    "message": message,
+                }
+                print(to_json_line(progress_json), flush=True)
+
+    drain.join()
+    process.stderr.close()
+    process.wait()
+
+    return process.returncode, "".join(stderr_chunks)
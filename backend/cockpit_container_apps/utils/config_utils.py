@@ -2,6 +2,8 @@
 
 This module provides shared utilities for configuration management:
 - Path construction for config files
+- Safe YAML parsing with the LibYAML loader when available
+- Config schema loading (cached per file version)
 - Environment file parsing
 - Environment file writing (atomic)
 - Config value validation
@@ -9,15 +11,38 @@ This module provides shared utilities for configuration management:
 
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import yaml
+
 logger = logging.getLogger(__name__)
 
+# Prefer the LibYAML-backed loader; fall back when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
+    logger.debug("PyYAML built without LibYAML, YAML files use the pure-Python loader")
+
+
 # Base paths for config files
 CONFIG_SCHEMA_BASE = Path("/var/lib/container-apps")
 CONFIG_BASE = Path("/etc/container-apps")
 
+# Package names are alphanumeric with hyphens/underscores only
+_PACKAGE_NAME_RE = re.compile(r"[a-zA-Z0-9_-]+")
+
+# One non-blank, non-comment env file line, with surrounding whitespace
+# excluded: the key and, if present, the "=value" part. Scanning the whole
+# file with findall replaces per-line split/strip calls.
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*(?=[^\s#])([^=\n]*?)[^\S\n]*(=.*?)?[^\S\n]*$",
+    re.MULTILINE,
+)
+
 
 def get_config_schema_path(package: str) -> Path:
     """Get path to config schema file.
@@ -84,10 +109,68 @@ def _validate_package_name(package: str) -> None:
         raise ValueError(f"Invalid package name: {package}")
 
     # Package names should be alphanumeric with hyphens/underscores only
-    if not re.match(r"^[a-zA-Z0-9_-]+$", package):
+    if not _PACKAGE_NAME_RE.fullmatch(package):
         raise ValueError(f"Invalid package name: {package}")
 
 
+def yaml_safe_load(data: bytes | str) -> Any:
+    """Parse a YAML document with the safe loader, backed by LibYAML if available.
+
+    Args:
+        data: YAML document; bytes are decoded by the loader itself
+
+    Returns:
+        Parsed YAML document
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML
+    """
+    return yaml.load(data, Loader=_SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_schema_cached(
+    path: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> Any:
+    """Load and parse a config schema file.
+
+    Results are cached per (path, mtime_ns, size), so an unchanged schema is
+    only parsed once while an edited one is picked up on the next call.
+
+    Args:
+        path: Path to the schema file
+        mtime_ns: Modification time of the file, used as part of the cache key
+        size: Size of the file in bytes, used as part of the cache key
+
+    Returns:
+        Parsed YAML document (shared between callers; do not mutate)
+
+    Raises:
+        yaml.YAMLError: If the schema is not valid YAML
+        OSError: If the schema file cannot be read
+    """
+    return yaml_safe_load(path.read_bytes())
+
+
+def load_config_schema(path: Path) -> Any:
+    """Load a config schema file, reusing the parsed result while it is unchanged.
+
+    Args:
+        path: Path to config.yml schema file
+
+    Returns:
+        Parsed YAML document (shared between callers; do not mutate)
+
+    Raises:
+        yaml.YAMLError: If the schema is not valid YAML
+        OSError: If the schema file cannot be read
+    """
+    stat = path.stat()
+    return _load_schema_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
 def parse_env_file(path: Path) -> dict[str, str]:
     """Parse environment file into key-value dict.
 
@@ -106,32 +189,21 @@ def parse_env_file(path: Path) -> dict[str, str]:
     if not path.exists():
         return {}
 
-    env_vars = {}
-
     try:
         content = path.read_text()
     except (OSError, PermissionError) as e:
         logger.error(f"Failed to read env file {path}: {e}")
         raise
 
-    for line in content.splitlines():
-        # Strip whitespace
-        line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            continue
+    env_vars = {}
 
-        # Split on first = only
-        if "=" not in line:
-            logger.warning(f"Malformed line in {path}: {line}")
+    for key, assignment in _ENV_LINE_RE.findall(content):
+        # Lines without "=" are not assignments
+        if not assignment:
+            logger.warning(f"Malformed line in {path}: {key}")
             continue
 
-        key, value = line.split("=", 1)
-        key = key.strip()
-
-        # Strip leading/trailing whitespace from value
-        value = value.strip()
+        value = assignment[1:].lstrip()
 
         # Check if value starts with a quote (quotes protect inline comments)
         if value.startswith('"') or value.startswith("'"):
@@ -173,14 +245,14 @@ def write_env_file(path: Path, config: dict[str, str]) -> None:
     # Write to temporary file first (atomic write pattern)
     temp_path = path.parent / f".{path.name}.tmp"
 
+    # Quote values if they contain spaces
+    content = "".join(
+        f'{key}="{value}"\n' if " " in value else f"{key}={value}\n"
+        for key, value in sorted(config.items())
+    )
+
     try:
-        with temp_path.open("w") as f:
-            for key, value in sorted(config.items()):
-                # Quote values if they contain spaces
-                if " " in value:
-                    f.write(f'{key}="{value}"\n')
-                else:
-                    f.write(f"{key}={value}\n")
+        temp_path.write_text(content)
 
         # Atomic rename
         temp_path.rename(path)
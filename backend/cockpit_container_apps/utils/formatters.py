@@ -8,11 +8,14 @@ serialized to JSON by the CLI.
 
 Formatting Functions:
     to_json(data) - Convert any JSON-serializable data to formatted JSON string
+    to_json_bytes(data) - Same formatting as to_json, as UTF-8 bytes
+    to_json_line(data) - Convert data to a compact single-line JSON string
     format_package(pkg) - Format apt.Package for list views (compact)
     format_package_details(pkg) - Format apt.Package with full details
     format_dependency(dep_or) - Format dependency OR-group to list of dicts
 
 Output Considerations:
+    - Serialized with orjson when available, falling back to the json module
     - All output uses UTF-8 encoding
     - Pretty-printed with 2-space indentation for human readability
     - Sort keys disabled to preserve logical field ordering
@@ -50,6 +53,11 @@ Field Mappings:
 import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 
 def to_json(data: Any) -> str:
     """Convert data to JSON string with consistent formatting.
@@ -63,14 +71,55 @@ def to_json(data: Any) -> str:
     Raises:
         TypeError: If data is not JSON-serializable
     """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=False)
 
 
+def to_json_bytes(data: Any) -> bytes:
+    """Convert data to UTF-8 encoded JSON, formatted as by to_json.
+
+    Lets large results be written to a binary stream without building an
+    intermediate str and encoding it again.
+
+    Args:
+        data: Data to serialize (dict, list, or JSON-serializable type)
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If data is not JSON-serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return to_json(data).encode()
+
+
+def to_json_line(data: Any) -> str:
+    """Convert data to a compact JSON string on a single line.
+
+    Used for streamed JSON-lines output such as install/remove progress.
+
+    Args:
+        data: Data to serialize (dict, list, or JSON-serializable type)
+
+    Returns:
+        JSON string representation without newlines
+
+    Raises:
+        TypeError: If data is not JSON-serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
 def format_package(pkg: Any) -> dict[str, Any]:
     """Format an apt.Package object as a dictionary for list views.
 
     Container-apps extension: Includes categories extracted from debtags
-    for client-side filtering.
+    for client-side filtering, in Tag field order with repeats listed once.
 
     Args:
         pkg: python-apt Package object
@@ -78,9 +127,7 @@ def format_package(pkg: Any) -> dict[str, Any]:
     Returns:
         Dictionary with basic package information including categories
     """
-    from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import (
-        get_tags_by_facet,
-    )
+    from cockpit_container_apps.utils.tag_cache import get_facet_values
 
     # Get candidate version (available for install)
     candidate = pkg.candidate
@@ -91,8 +138,9 @@ def format_package(pkg: Any) -> dict[str, Any]:
         version = "unknown"
         section = "unknown"
 
-    # Extract categories from debtags (container-apps extension)
-    categories = get_tags_by_facet(pkg, "category")
+    # Extract categories from debtags (container-apps extension), reusing the
+    # Tag field already read for store filtering
+    categories = list(get_facet_values(pkg, "category"))
 
     return {
         "name": pkg.name,
@@ -104,6 +152,17 @@ def format_package(pkg: Any) -> dict[str, Any]:
     }
 
 
+# Detail fields of a package without a candidate version (immutable values only,
+# so the dict can be shared between calls)
+_NO_CANDIDATE_DETAILS: dict[str, Any] = {
+    "priority": "optional",
+    "homepage": "",
+    "maintainer": "",
+    "size": 0,
+    "installedSize": 0,
+}
+
+
 def format_package_details(pkg: Any) -> dict[str, Any]:
     """Format an apt.Package object as a detailed dictionary.
 
@@ -132,21 +191,16 @@ def format_package_details(pkg: Any) -> dict[str, Any]:
 
     # Optional fields from candidate version
     if candidate:
-        result["priority"] = candidate.priority if hasattr(candidate, "priority") else "optional"
-        result["homepage"] = candidate.homepage if candidate.homepage else ""
-        result["maintainer"] = (
-            candidate.record.get("Maintainer", "") if hasattr(candidate, "record") else ""
-        )
-        result["size"] = candidate.size if hasattr(candidate, "size") else 0
-        result["installedSize"] = (
-            candidate.installed_size if hasattr(candidate, "installed_size") else 0
-        )
+        # getattr with a default reads each property once; hasattr followed by
+        # an access would evaluate it twice (record parses the whole stanza)
+        record = getattr(candidate, "record", None)
+        result["priority"] = getattr(candidate, "priority", "optional")
+        result["homepage"] = candidate.homepage or ""
+        result["maintainer"] = record.get("Maintainer", "") if record is not None else ""
+        result["size"] = getattr(candidate, "size", 0)
+        result["installedSize"] = getattr(candidate, "installed_size", 0)
     else:
-        result["priority"] = "optional"
-        result["homepage"] = ""
-        result["maintainer"] = ""
-        result["size"] = 0
-        result["installedSize"] = 0
+        result.update(_NO_CANDIDATE_DETAILS)
 
     # Dependencies (will be populated by command handler)
     result["dependencies"] = []
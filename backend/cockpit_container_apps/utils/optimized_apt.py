@@ -7,25 +7,36 @@ particularly for filtering packages by origin to avoid full cache iteration.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import sys
+import weakref
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     import apt
 
 logger = logging.getLogger(__name__)
 
+# Origin -> package name indexes, keyed weakly on the apt.Cache they describe.
+# Each entry records the cache generation (the underlying apt_pkg cache,
+# replaced on Cache.open()) so a reopened cache is re-indexed.
+_ORIGIN_INDEX: weakref.WeakKeyDictionary[Any, tuple[Any, dict[str, set[str]]]] = (
+    weakref.WeakKeyDictionary()
+)
 
-def get_package_names_by_origin_fast(origin_name: str) -> set[str]:
-    """Fast origin filtering using apt_pkg (low-level API).
+# Origin (or label) per package, keyed weakly on the apt.Package. Reopening a
+# cache creates new Package objects, so stale entries are never consulted.
+# Values are interned: thousands of packages share a handful of origin names.
+_ORIGIN_KEYS: weakref.WeakKeyDictionary[Any, str | None] = weakref.WeakKeyDictionary()
 
-    This is much faster than iterating through apt.Cache() because it works
-    at the C++ level, avoiding Python FFI overhead.
 
-    Args:
-        origin_name: The origin name to filter by (e.g., "Hat Labs")
+def _open_apt_pkg_cache() -> Any:
+    """Open a low-level apt_pkg cache with APT's progress output suppressed.
 
     Returns:
-        Set of package names from the specified origin
+        apt_pkg.Cache object
     """
     import os
 
@@ -44,7 +55,7 @@ def get_package_names_by_origin_fast(origin_name: str) -> set[str]:
         os.dup2(devnull_fd, 2)
 
         apt_pkg.init()
-        cache = apt_pkg.Cache()
+        return apt_pkg.Cache()
     finally:
         # Restore original stdout/stderr
         os.dup2(old_stdout_fd, 1)
@@ -55,30 +66,84 @@ def get_package_names_by_origin_fast(origin_name: str) -> set[str]:
         os.close(old_stdout_fd)
         os.close(old_stderr_fd)
 
-    matching_names = set()
+
+def _build_origin_index(pkg_cache: Any) -> dict[str, set[str]]:
+    """Map every origin to the names of its packages in a single cache walk.
+
+    A package is listed under each origin (or label, if the origin is empty)
+    found in the file list of its current version, falling back to its first
+    available version.
+
+    Args:
+        pkg_cache: apt_pkg.Cache object
+
+    Returns:
+        Dictionary mapping origin name to a set of package names
+    """
+    index: defaultdict[str, set[str]] = defaultdict(set)
 
     # Iterate at C++ level - much faster than apt.Cache
-    for pkg in cache.packages:
-        # Check if package has a candidate version
-        if not pkg.current_ver and not pkg.has_versions:
-            continue
-
-        # Get the version to check (prefer current, fall back to any version)
-        if pkg.current_ver:
-            ver = pkg.current_ver
-        elif pkg.version_list:
-            ver = pkg.version_list[0]
-        else:
-            continue
+    for pkg in pkg_cache.packages:
+        # Each apt_pkg attribute read builds a new Python object, so read the
+        # version once (prefer current, fall back to the first available one)
+        ver = pkg.current_ver
+        if not ver:
+            if not pkg.has_versions:
+                continue
+            version_list = pkg.version_list
+            if not version_list:
+                continue
+            ver = version_list[0]
+
+        name = pkg.name
 
         # Check origins in version files
         for ver_file, _index in ver.file_list:
             # Check origin field first, fall back to label
-            pkg_origin = ver_file.origin or ver_file.label or ""
+            index[ver_file.origin or ver_file.label or ""].add(name)
+
+    return dict(index)
+
+
+def _get_origin_index(cache: apt.Cache) -> dict[str, set[str]]:
+    """Return the origin index for an apt.Cache, building it on first use.
 
-            if pkg_origin == origin_name:
-                matching_names.add(pkg.name)
-                break  # Found a match, no need to check other files
+    The underlying apt_pkg cache of an apt.Cache is walked directly when
+    available, avoiding a second cache open. The index is reused until the
+    apt.Cache is reopened.
+
+    Args:
+        cache: APT cache object
+
+    Returns:
+        Dictionary mapping origin name to a set of package names
+    """
+    import apt_pkg
+
+    generation = getattr(cache, "_cache", None)
+    cached = _ORIGIN_INDEX.get(cache)
+    if cached is not None and cached[0] is generation:
+        return cached[1]
+
+    pkg_cache = generation if isinstance(generation, apt_pkg.Cache) else _open_apt_pkg_cache()
+    index = _build_origin_index(pkg_cache)
+    _ORIGIN_INDEX[cache] = (generation, index)
+    return index
+
+
+def get_package_names_by_origin_fast(origin_name: str) -> set[str]:
+    """Fast origin filtering using apt_pkg (low-level API).
+
+    This is much faster than iterating through apt.Cache() because it works
+    at the C++ level, avoiding Python FFI overhead.
+
+    Args:
+        origin_name: The origin name to filter by (e.g., "Hat Labs")
+
+    Returns:
+        Set of package names from the specified origin
+    """
+    matching_names = _build_origin_index(_open_apt_pkg_cache()).get(origin_name, set())
 
     logger.info(
         "Fast origin filter found %d packages from '%s'",
@@ -102,12 +167,13 @@ def _get_package_origin(package: apt.Package) -> str | None:
         Origin name string, or None if unavailable
     """
     # Skip packages without candidate version
-    if not hasattr(package, "candidate") or package.candidate is None:
+    candidate = getattr(package, "candidate", None)
+    if candidate is None:
         return None
 
     # Get package origins
     try:
-        origins = package.candidate.origins
+        origins = candidate.origins
         if not origins:
             return None
     except (AttributeError, TypeError):
@@ -134,12 +200,55 @@ def _get_package_origin(package: apt.Package) -> str | None:
         return None
 
 
+def _load_packages(cache: apt.Cache, names: Iterable[str]) -> list[apt.Package]:
+    """Load packages by name from apt.Cache, skipping names it doesn't know.
+
+    Args:
+        cache: APT cache object
+        names: Package names to load
+
+    Returns:
+        List of packages found in the cache
+    """
+    packages: list[apt.Package] = []
+    append = packages.append
+    for name in names:
+        try:
+            append(cache[name])
+        except KeyError:
+            logger.debug("Package %s not found in cache", name)
+    return packages
+
+
+def get_package_origin(package: apt.Package) -> str | None:
+    """Get a package's origin name, reading the candidate's origins only once.
+
+    Same result as _get_package_origin, memoized per package object.
+
+    Args:
+        package: APT package object
+
+    Returns:
+        Origin name string (label if origin is empty), or None if unavailable
+    """
+    try:
+        return _ORIGIN_KEYS[package]
+    except KeyError:
+        pass
+
+    origin = _get_package_origin(package)
+    if origin is not None:
+        origin = sys.intern(origin)
+    _ORIGIN_KEYS[package] = origin
+    return origin
+
+
 def get_packages_by_origin(cache: apt.Cache, origin_name: str) -> list[apt.Package]:
     """Get all packages from a specific origin.
 
     This function provides an optimized way to filter packages by origin,
-    using the fast apt_pkg API to get package names, then only loading
-    those specific packages from the apt.Cache.
+    using a per-cache origin index built with the fast apt_pkg API, then only
+    loading those specific packages from the apt.Cache.
 
     Args:
         cache: APT cache object
@@ -154,18 +263,11 @@ def get_packages_by_origin(cache: apt.Cache, origin_name: str) -> list[apt.Packa
         >>> print(f"Found {len(marine_packages)} packages from Hat Labs")
         Found 20 packages from Hat Labs
     """
-    # Use fast apt_pkg filtering to get package names
-    matching_names = get_package_names_by_origin_fast(origin_name)
+    # Use the apt_pkg origin index to get package names
+    matching_names = _get_origin_index(cache).get(origin_name, ())
 
     # Only load the specific packages we need from apt.Cache
-    matching_packages = []
-    for name in matching_names:
-        try:
-            pkg = cache[name]
-            matching_packages.append(pkg)
-        except KeyError:
-            logger.debug("Package %s not found in cache", name)
-            continue
+    matching_packages = _load_packages(cache, matching_names)
 
     logger.info(
         "Loaded %d packages from origin '%s'",
@@ -176,15 +278,15 @@ def get_packages_by_origin(cache: apt.Cache, origin_name: str) -> list[apt.Packa
     return matching_packages
 
 
-def get_packages_by_origins(cache: apt.Cache, origin_names: list[str]) -> list[apt.Package]:
+def get_packages_by_origins(cache: apt.Cache, origin_names: Sequence[str]) -> list[apt.Package]:
     """Get all packages from multiple origins.
 
-    Uses the fast apt_pkg API to filter packages by origin, then loads only
-    the matching packages from apt.Cache.
+    Uses a per-cache origin index built with the fast apt_pkg API, then loads
+    only the matching packages from apt.Cache.
 
     Args:
         cache: APT cache object
-        origin_names: List of origin names to filter by (e.g., ["Hat Labs", "Debian"])
+        origin_names: Origin names to filter by (e.g., ["Hat Labs", "Debian"])
 
     Returns:
         List of packages from any of the specified origins
@@ -198,21 +300,12 @@ def get_packages_by_origins(cache: apt.Cache, origin_names: list[str]) -> list[a
     if not origin_names:
         return []
 
-    # Collect package names from all origins
-    all_matching_names = set()
-    for origin_name in origin_names:
-        matching_names = get_package_names_by_origin_fast(origin_name)
-        all_matching_names.update(matching_names)
+    # Collect package names from all origins in one set union
+    index = _get_origin_index(cache)
+    all_matching_names = set[str]().union(*(index.get(name, ()) for name in origin_names))
 
     # Load the specific packages we need
-    matching_packages = []
-    for name in all_matching_names:
-        try:
-            pkg = cache[name]
-            matching_packages.append(pkg)
-        except KeyError:
-            logger.debug("Package %s not found in cache", name)
-            continue
+    matching_packages = _load_packages(cache, all_matching_names)
 
     logger.info(
         "Loaded %d packages from origins %s",
@@ -8,30 +8,49 @@ Store configurations define filters for creating curated package collections
 from __future__ import annotations
 
 import logging
+import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from cockpit_container_apps.utils.config_utils import yaml_safe_load
 from cockpit_container_apps.vendor.cockpit_apt_utils.errors import APTBridgeError
 
 logger = logging.getLogger(__name__)
 
 STORE_CONFIG_DIR = Path("/etc/container-apps/stores")
 
+# Required top-level store fields, in the order they are reported when missing
+_REQUIRED_STORE_FIELDS = ("id", "name", "description", "filters")
 
-@dataclass
+# Filter keys, each holding an optional list of values
+_FILTER_FIELDS = ("include_origins", "include_sections", "include_tags", "include_packages")
+
+# Required keys of each category metadata entry
+_REQUIRED_METADATA_KEYS = frozenset({"id", "label"})
+
+
+@dataclass(frozen=True, slots=True)
 class StoreFilter:
-    """Filter criteria for a store."""
+    """Filter criteria for a store.
 
-    include_origins: list[str]
-    include_sections: list[str]
-    include_tags: list[str]
-    include_packages: list[str]
+    Instances are immutable; list arguments are stored as tuples.
+    """
+
+    include_origins: tuple[str, ...]
+    include_sections: tuple[str, ...]
+    include_tags: tuple[str, ...]
+    include_packages: tuple[str, ...]
 
     def __post_init__(self) -> None:
-        """Validate that at least one filter type is specified."""
+        """Normalize filter lists to tuples and validate that at least one is specified."""
+        for name in _FILTER_FIELDS:
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+
         if not any(
             [
                 self.include_origins,
@@ -43,7 +62,7 @@ class StoreFilter:
             raise ValueError("At least one filter type must be specified")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CategoryMetadata:
     """Optional metadata for enhancing category display.
 
@@ -57,9 +76,14 @@ class CategoryMetadata:
     description: str | None = None  # Category description
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StoreConfig:
-    """Store configuration."""
+    """Store configuration.
+
+    Instances are immutable; category metadata is stored as a tuple. They are
+    not hashable in general, since fields such as icon hold values straight from
+    the YAML file.
+    """
 
     id: str
     name: str
@@ -67,10 +91,13 @@ class StoreConfig:
     filters: StoreFilter
     icon: str | None = None
     banner: str | None = None
-    category_metadata: list[CategoryMetadata] | None = None
+    category_metadata: tuple[CategoryMetadata, ...] | None = None
 
     def __post_init__(self) -> None:
-        """Validate store ID format."""
+        """Normalize category metadata to a tuple and validate store ID format."""
+        if self.category_metadata is not None:
+            object.__setattr__(self, "category_metadata", tuple(self.category_metadata))
+
         if not self.id or not self.id.replace("-", "").replace("_", "").isalnum():
             raise ValueError(f"Invalid store ID: {self.id}")
 
@@ -83,10 +110,9 @@ def _validate_store_dict(data: dict[str, Any], filepath: Path) -> None:
         filepath: Path to config file for error messages
 
     Raises:
-        APTBridgeError: If required fields are missing
+        APTBridgeError: If required fields are missing or filters are malformed
     """
-    required_fields = ["id", "name", "description", "filters"]
-    missing = [field for field in required_fields if field not in data]
+    missing = [field for field in _REQUIRED_STORE_FIELDS if field not in data]
 
     if missing:
         raise APTBridgeError(
@@ -101,6 +127,15 @@ def _validate_store_dict(data: dict[str, Any], filepath: Path) -> None:
             "INVALID_STORE_CONFIG",
         )
 
+    # Each filter is a list of values; a scalar cannot be converted to one
+    for field in _FILTER_FIELDS:
+        value = data["filters"].get(field)
+        if value is not None and not isinstance(value, list):
+            raise APTBridgeError(
+                f"Store config {filepath.name}: filters.{field} must be a list",
+                "INVALID_STORE_CONFIG",
+            )
+
 
 def _parse_filters(filters_dict: dict[str, Any]) -> StoreFilter:
     """Parse filter configuration from dictionary.
@@ -115,30 +150,34 @@ def _parse_filters(filters_dict: dict[str, Any]) -> StoreFilter:
         ValueError: If filter configuration is invalid
     """
     return StoreFilter(
-        include_origins=filters_dict.get("include_origins", []),
-        include_sections=filters_dict.get("include_sections", []),
-        include_tags=filters_dict.get("include_tags", []),
-        include_packages=filters_dict.get("include_packages", []),
+        # Interned to share the objects used by per-package origin lookups
+        include_origins=tuple(
+            sys.intern(origin) if isinstance(origin, str) else origin
+            for origin in filters_dict.get("include_origins") or ()
+        ),
+        include_sections=tuple(filters_dict.get("include_sections") or ()),
+        include_tags=tuple(filters_dict.get("include_tags") or ()),
+        include_packages=tuple(filters_dict.get("include_packages") or ()),
     )
 
 
 def _parse_category_metadata(
-    metadata_list: list[dict[str, Any]] | None,
-) -> list[CategoryMetadata] | None:
+    metadata_list: list[Any] | None,
+) -> tuple[CategoryMetadata, ...] | None:
     """Parse category metadata for enhanced display.
 
     Args:
-        metadata_list: List of category metadata dictionaries
+        metadata_list: List of category metadata entries (non-mappings are skipped)
 
     Returns:
-        List of CategoryMetadata objects or None
+        Tuple of CategoryMetadata objects or None
     """
     if not metadata_list:
         return None
 
-    category_metadata = []
+    category_metadata: list[CategoryMetadata] = []
     for meta_dict in metadata_list:
-        if not all(k in meta_dict for k in ["id", "label"]):
+        if not isinstance(meta_dict, dict) or not meta_dict.keys() >= _REQUIRED_METADATA_KEYS:
             logger.warning(
                 "Skipping invalid category metadata (missing required fields): %s",
                 meta_dict,
@@ -154,12 +193,50 @@ def _parse_category_metadata(
             )
         )
 
-    return category_metadata if category_metadata else None
+    return tuple(category_metadata) if category_metadata else None
+
+
+def _parse_store_dict(data: dict[str, Any], filepath: Path) -> StoreConfig:
+    """Build a store configuration from parsed YAML data.
+
+    Args:
+        data: Parsed YAML data (root mapping of the store file)
+        filepath: Path to config file for error messages
+
+    Returns:
+        StoreConfig object
+
+    Raises:
+        APTBridgeError: If required fields are missing or malformed
+        ValueError: If the filters or store ID are invalid
+    """
+    # Validate required fields
+    _validate_store_dict(data, filepath)
+
+    # Parse filters
+    filters = _parse_filters(data["filters"])
+
+    # Parse category metadata if present
+    category_metadata = _parse_category_metadata(data.get("category_metadata"))
+
+    return StoreConfig(
+        id=data["id"],
+        name=data["name"],
+        description=data["description"],
+        filters=filters,
+        icon=data.get("icon"),
+        banner=data.get("banner"),
+        category_metadata=category_metadata,
+    )
 
 
 def _load_store_config(filepath: Path) -> StoreConfig | None:
     """Load and parse a single store configuration file.
 
+    Parsed configs are reused until the file's modification time or size
+    changes (the size catches rewrites within the filesystem's timestamp
+    granularity).
+
     Args:
         filepath: Path to YAML configuration file
 
@@ -167,31 +244,43 @@ def _load_store_config(filepath: Path) -> StoreConfig | None:
         StoreConfig object or None if loading fails
     """
     try:
-        with filepath.open() as f:
-            data = yaml.safe_load(f)
+        stat = filepath.stat()
+    except OSError as e:
+        logger.warning("Failed to read store config %s: %s", filepath.name, e)
+        return None
 
-        if not isinstance(data, dict):
-            logger.warning("Store config %s: root element must be a dictionary", filepath.name)
-            return None
+    return _load_store_config_cached(filepath, stat.st_mtime_ns, stat.st_size)
 
-        # Validate required fields
-        _validate_store_dict(data, filepath)
 
-        # Parse filters
-        filters = _parse_filters(data["filters"])
+@lru_cache(maxsize=64)
+def _load_store_config_cached(
+    filepath: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> StoreConfig | None:
+    """Load and parse a store configuration file.
 
-        # Parse category metadata if present
-        category_metadata = _parse_category_metadata(data.get("category_metadata"))
+    Results are cached per (filepath, mtime_ns, size); StoreConfig is immutable,
+    so the cached object is shared between callers.
 
-        return StoreConfig(
-            id=data["id"],
-            name=data["name"],
-            description=data["description"],
-            filters=filters,
-            icon=data.get("icon"),
-            banner=data.get("banner"),
-            category_metadata=category_metadata,
-        )
+    Args:
+        filepath: Path to YAML configuration file
+        mtime_ns: Modification time of the file, used as part of the cache key
+        size: Size of the file in bytes, used as part of the cache key
+
+    Returns:
+        StoreConfig object or None if loading fails
+    """
+    try:
+        # Parse the whole file from one buffer rather than letting the loader
+        # pull it through file.read() calls
+        data = yaml_safe_load(filepath.read_bytes())
+
+        if not isinstance(data, dict):
+            logger.warning("Store config %s: root element must be a dictionary", filepath.name)
+            return None
+
+        return _parse_store_dict(data, filepath)
 
     except yaml.YAMLError as e:
         logger.warning("Failed to parse YAML in %s: %s", filepath.name, e)
@@ -233,8 +322,17 @@ def load_stores(config_dir: Path | None = None) -> list[StoreConfig]:
     stores: list[StoreConfig] = []
     seen_ids: set[str] = set()
 
-    # Scan for YAML files
-    yaml_files = list(config_dir.glob("*.yaml")) + list(config_dir.glob("*.yml"))
+    # Scan for YAML files in a single directory pass
+    try:
+        with os.scandir(config_dir) as entries:
+            yaml_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+            ]
+    except OSError as e:
+        logger.warning("Failed to list store config directory %s: %s", config_dir, e)
+        return []
 
     for filepath in sorted(yaml_files):  # Sort for deterministic order
         store = _load_store_config(filepath)
@@ -9,11 +9,12 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from cockpit_container_apps.utils.optimized_apt import get_packages_by_origins
-from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import parse_package_tags
-from cockpit_container_apps.vendor.cockpit_apt_utils.repository_parser import get_package_repository
+from cockpit_container_apps.utils.optimized_apt import get_package_origin, get_packages_by_origins
+from cockpit_container_apps.utils.tag_cache import get_tags
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import apt
 
     from cockpit_container_apps.utils.store_config import StoreConfig
@@ -48,60 +49,55 @@ def matches_store_filter(package: apt.Package, store: StoreConfig) -> bool:
     """
     filters = store.filters
 
-    # Collect match results for each specified filter type
-    matches = []
-
-    if filters.include_origins:
-        matches.append(_matches_origin_filter(package, filters.include_origins))
-
-    if filters.include_sections:
-        matches.append(_matches_section_filter(package, filters.include_sections))
+    # Filter types are OR-ed, so stop at the first match. Cheap checks run
+    # first: the name needs no candidate lookup, origin and section read the
+    # candidate, and tag matching reads and parses the Tag record, so it runs last.
+    if filters.include_packages and _matches_packages_filter(package, filters.include_packages):
+        return True
 
-    if filters.include_tags:
-        matches.append(_matches_tags_filter(package, filters.include_tags))
+    if filters.include_origins and _matches_origin_filter(package, filters.include_origins):
+        return True
 
-    if filters.include_packages:
-        matches.append(_matches_packages_filter(package, filters.include_packages))
+    if filters.include_sections and _matches_section_filter(package, filters.include_sections):
+        return True
 
-    # Return True if ANY filter matched (OR logic between filter types)
-    return any(matches)
+    return bool(filters.include_tags) and _matches_tags_filter(package, filters.include_tags)
 
 
-def _matches_origin_filter(package: apt.Package, origins: list[str]) -> bool:
+def _matches_origin_filter(package: apt.Package, origins: tuple[str, ...]) -> bool:
     """Check if package origin matches any of the specified origins.
 
     Args:
         package: APT package object
-        origins: List of acceptable origin names
+        origins: Tuple of acceptable origin names
 
     Returns:
         True if package origin is in the list (OR logic)
     """
-    repo = get_package_repository(package)
-    if repo is None:
-        return False
-
     # Match on origin (or label if origin is empty)
-    package_origin = repo.origin if repo.origin else repo.label
+    package_origin = get_package_origin(package)
+    if package_origin is None:
+        return False
 
     return package_origin in origins
 
 
-def _matches_section_filter(package: apt.Package, sections: list[str]) -> bool:
+def _matches_section_filter(package: apt.Package, sections: tuple[str, ...]) -> bool:
     """Check if package section matches any of the specified sections.
 
     Args:
         package: APT package object
-        sections: List of acceptable section names
+        sections: Tuple of acceptable section names
 
     Returns:
         True if package section is in the list (OR logic)
     """
     try:
-        if not hasattr(package, "candidate") or package.candidate is None:
+        candidate = getattr(package, "candidate", None)
+        if candidate is None:
             return False
 
-        section = package.candidate.section
+        section = candidate.section
         if not section:
             return False
 
@@ -112,31 +108,26 @@ def _matches_section_filter(package: apt.Package, sections: list[str]) -> bool:
         return False
 
 
-def _matches_tags_filter(package: apt.Package, tags: list[str]) -> bool:
+def _matches_tags_filter(package: apt.Package, tags: tuple[str, ...]) -> bool:
     """Check if package has any of the specified tags.
 
     Args:
         package: APT package object
-        tags: List of acceptable tag strings
+        tags: Tuple of acceptable tag strings
 
     Returns:
         True if package has at least one matching tag (OR logic)
     """
-    package_tags = parse_package_tags(package)
-
-    if not package_tags:
-        return False
-
     # OR logic: package needs at least one matching tag
-    return any(tag in package_tags for tag in tags)
+    return not get_tags(package).isdisjoint(tags)
 
 
-def _matches_packages_filter(package: apt.Package, packages: list[str]) -> bool:
+def _matches_packages_filter(package: apt.Package, packages: tuple[str, ...]) -> bool:
     """Check if package name is in the explicit package list.
 
     Args:
         package: APT package object
-        packages: List of explicit package names
+        packages: Tuple of explicit package names
 
     Returns:
         True if package name is in the list (OR logic)
@@ -144,7 +135,7 @@ def _matches_packages_filter(package: apt.Package, packages: list[str]) -> bool:
     return package.name in packages
 
 
-def get_pre_filtered_packages(cache: apt.Cache, store: StoreConfig) -> list[apt.Package]:
+def get_pre_filtered_packages(cache: apt.Cache, store: StoreConfig) -> Iterable[apt.Package]:
     """Get packages pre-filtered by origin for optimization.
 
     This function provides an optimized path for stores that specify origin filters.
@@ -156,14 +147,15 @@ def get_pre_filtered_packages(cache: apt.Cache, store: StoreConfig) -> list[apt.
         store: Store configuration with filter criteria
 
     Returns:
-        List of packages to process (pre-filtered by origin if applicable)
+        Packages to process: a list pre-filtered by origin if applicable,
+        otherwise the cache itself (iterate it once; it is not copied)
 
     Example:
         >>> # Store with origin filter - returns ~20 packages
         >>> packages = get_pre_filtered_packages(cache, marine_store)
         >>> # Much faster than iterating 50,000+ packages
 
-        >>> # Store without origin filter - returns full cache
+        >>> # Store without origin filter - returns the cache itself
         >>> packages = get_pre_filtered_packages(cache, general_store)
         >>> # Falls back to full iteration for complex filters
     """
@@ -189,12 +181,12 @@ def get_pre_filtered_packages(cache: apt.Cache, store: StoreConfig) -> list[apt.
 
         return pre_filtered
 
-    # No origin filter - return full cache as list for consistent interface
+    # No origin filter - iterate the full cache in place rather than copying it
     logger.info(
         "No origin filter for store '%s', processing full cache",
         store.id,
     )
-    return list(cache)
+    return cache
 
 
 def count_matching_packages(cache: apt.Cache, store: StoreConfig) -> int:
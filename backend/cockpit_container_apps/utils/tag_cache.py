@@ -0,0 +1,229 @@
+"""Fast debtag lookups for APT packages.
+
+This module provides a tag set accessor for filter matching:
+- One regex scan per raw Tag field instead of split/strip passes
+- Parsed tag sets memoized by raw Tag string (many packages share them)
+- Tag fields memoized per package, so the Tag record is read once per package
+- Frozensets for O(1) membership and set-disjointness checks
+- Facet values (e.g. categories) in Tag field order, from the memoized parse
+- Full-cache tag walks at the apt_pkg level, without apt.Package wrappers
+- Memoized display labels for auto-derived categories
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from cockpit_container_apps.vendor.cockpit_apt_utils.debtag_parser import (
+    derive_category_label,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+    import apt
+
+logger = logging.getLogger(__name__)
+
+# One comma-separated tag with surrounding whitespace excluded, matching the
+# result of splitting the Tag field on "," and stripping each item.
+_TAG_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+# Raw Tag field per package, keyed weakly on the apt.Package. Reading a
+# candidate's record parses the whole package stanza, so filter matching and
+# category extraction share one read. Reopening a cache creates new Package
+# objects, so stale entries are never consulted.
+_PACKAGE_TAG_FIELDS: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=1024)
+def parse_tag_list(raw: str) -> tuple[str, ...]:
+    """Parse a raw Tag field into its tags, in field order.
+
+    Args:
+        raw: Tag field value (e.g., "role::container-app, field::marine")
+
+    Returns:
+        Tuple of tag strings, each listed once
+    """
+    return tuple(dict.fromkeys(_TAG_RE.findall(raw)))
+
+
+@lru_cache(maxsize=1024)
+def parse_tag_string(raw: str) -> frozenset[str]:
+    """Parse a raw Tag field into a set of tags.
+
+    Args:
+        raw: Tag field value (e.g., "role::container-app, field::marine")
+
+    Returns:
+        Frozenset of tag strings
+    """
+    return frozenset(parse_tag_list(raw))
+
+
+def _read_tag_field(package: apt.Package) -> str:
+    """Read the raw Tag field of a package's candidate version.
+
+    Args:
+        package: APT package object
+
+    Returns:
+        Tag field value (empty if the package has no candidate or tags)
+    """
+    try:
+        candidate = package.candidate
+        if not candidate:
+            return ""
+
+        return candidate.record.get("Tag", "") or ""
+    except (AttributeError, KeyError):
+        logger.debug("Error getting tags for package %s", package.name)
+        return ""
+
+
+def _get_tag_field(package: apt.Package) -> str:
+    """Get the raw Tag field of a package, reading the record once per package."""
+    try:
+        return _PACKAGE_TAG_FIELDS[package]
+    except KeyError:
+        pass
+
+    raw = _read_tag_field(package)
+    _PACKAGE_TAG_FIELDS[package] = raw
+    return raw
+
+
+def get_tags(package: apt.Package) -> frozenset[str]:
+    """Get the debtags of a package's candidate version.
+
+    The Tag record is read once per package object and reused afterwards.
+
+    Args:
+        package: APT package object
+
+    Returns:
+        Frozenset of tag strings (empty if the package has no candidate or tags)
+    """
+    raw = _get_tag_field(package)
+    return parse_tag_string(raw) if raw else frozenset()
+
+
+@lru_cache(maxsize=1024)
+def facet_values(tags: Collection[str], facet: str) -> tuple[str, ...]:
+    """Extract the values of one facet from a collection of tags.
+
+    Args:
+        tags: Tuple or frozenset of tag strings
+        facet: Facet name (e.g., "category")
+
+    Returns:
+        Tuple of non-empty values in the iteration order of tags, each listed
+        once (e.g., ("navigation", "monitoring"))
+    """
+    prefix = f"{facet}::"
+    start = len(prefix)
+    return tuple(
+        dict.fromkeys(tag[start:] for tag in tags if tag.startswith(prefix) and tag[start:])
+    )
+
+
+def get_facet_values(package: apt.Package, facet: str) -> tuple[str, ...]:
+    """Get the values of one debtag facet for a package.
+
+    Built on the per-package Tag field so it does not re-read the record.
+    Values keep their Tag field order, like the vendored get_tags_by_facet;
+    unlike it, a repeated value is listed once and empty values are skipped.
+
+    Args:
+        package: APT package object
+        facet: Facet name (e.g., "category")
+
+    Returns:
+        Tuple of facet values in Tag field order
+    """
+    raw = _get_tag_field(package)
+    return facet_values(parse_tag_list(raw), facet) if raw else ()
+
+
+def _iter_apt_pkg_candidate_tags(
+    pkg_cache: Any, depcache: Any
+) -> Iterator[tuple[str, bool, frozenset[str]]]:
+    """Walk an apt_pkg cache, reading the Tag field of each candidate version.
+
+    Args:
+        pkg_cache: apt_pkg.Cache object
+        depcache: apt_pkg.DepCache object used to pick candidate versions
+
+    Yields:
+        Tuples of (package name, is installed, frozenset of tag strings)
+    """
+    import apt_pkg
+
+    records = apt_pkg.PackageRecords(pkg_cache)
+    get_candidate_ver = depcache.get_candidate_ver
+
+    for pkg in pkg_cache.packages:
+        if not pkg.has_versions:
+            continue
+
+        ver = get_candidate_ver(pkg)
+        if ver is None:
+            continue
+
+        raw = ""
+        file_list = ver.file_list
+        if file_list and records.lookup(file_list[0]):
+            raw = apt_pkg.TagSection(records.record).get("Tag", "")
+
+        # Same name and installed state as apt.Package.name / is_installed
+        yield (
+            pkg.get_fullname(True),
+            pkg.current_ver is not None,
+            parse_tag_string(raw) if raw else frozenset(),
+        )
+
+
+def iter_candidate_tags(cache: apt.Cache) -> Iterator[tuple[str, bool, frozenset[str]]]:
+    """Yield the debtags of every package in the cache that has a candidate.
+
+    When the apt.Cache is backed by an apt_pkg cache, candidate records are
+    read at the apt_pkg level instead of creating an apt.Package (and candidate
+    Version) wrapper for each of the 50,000+ packages. Use this for walks that
+    visit the whole cache; per-package lookups should use get_tags.
+
+    Args:
+        cache: APT cache object
+
+    Yields:
+        Tuples of (package name, is installed, frozenset of tag strings)
+    """
+    pkg_cache = getattr(cache, "_cache", None)
+    depcache = getattr(cache, "_depcache", None)
+    if pkg_cache is not None and depcache is not None:
+        import apt_pkg
+
+        if isinstance(pkg_cache, apt_pkg.Cache):
+            yield from _iter_apt_pkg_candidate_tags(pkg_cache, depcache)
+            return
+
+    for package in cache:
+        if package.candidate:
+            yield package.name, package.is_installed, get_tags(package)
+
+
+@lru_cache(maxsize=256)
+def category_label(category_id: str) -> str:
+    """Get the auto-derived display label for a category ID.
+
+    Args:
+        category_id: Category ID (e.g., "navigation")
+
+    Returns:
+        Display label (e.g., "Navigation")
+    """
+    return derive_category_label(category_id)
@@ -2,6 +2,9 @@
 Pytest configuration and shared fixtures for cockpit-container-apps tests.
 """
 
+from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
 from unittest.mock import MagicMock
 
 import pytest
@@ -89,9 +92,26 @@ class MockDependency:
         self.version = version
 
 
+class MockOrigin(NamedTuple):
+    """Lightweight stand-in for apt.package.Origin."""
+
+    origin: str
+    label: str
+    suite: str = "stable"
+    archive: str = "stable"
+    codename: str = ""
+    component: str = "main"
+    site: str = ""
+    trusted: bool = True
+    not_automatic: bool = False
+
+
 class MockPackage:
     """Mock apt.Package for testing."""
 
+    # __weakref__ matches apt.Package, which per-package memo tables key on
+    __slots__ = ("name", "is_installed", "is_upgradable", "candidate", "installed", "__weakref__")
+
     def __init__(
         self,
         name: str,
@@ -112,51 +132,53 @@ class MockPackage:
         self.is_installed = installed
         self.is_upgradable = is_upgradable
 
-        # Candidate version (available for install)
-        self.candidate = MagicMock()
-        self.candidate.summary = summary
-        self.candidate.description = description
-        self.candidate.version = version
-        self.candidate.section = section
-        self.candidate.priority = priority
-        self.candidate.homepage = homepage
-        self.candidate.size = size
-        self.candidate.installed_size = installed_size
-        self.candidate.record = {"Maintainer": maintainer}
-
-        # Set up dependencies
-        if dependencies:
-            self.candidate.dependencies = dependencies
-        else:
-            self.candidate.dependencies = []
+        # Candidate version (available for install). A SimpleNamespace rather
+        # than a MagicMock keeps large fixture caches cheap to build.
+        self.candidate = SimpleNamespace(
+            summary=summary,
+            description=description,
+            version=version,
+            section=section,
+            priority=priority,
+            homepage=homepage,
+            size=size,
+            installed_size=installed_size,
+            record={"Maintainer": maintainer},
+            dependencies=dependencies or [],
+            origins=(),
+        )
 
         # Installed version (if package is installed)
         if installed:
-            self.installed = MagicMock()
-            self.installed.version = version
-            self.installed.summary = summary
-            self.installed.section = section
+            self.installed = SimpleNamespace(version=version, summary=summary, section=section)
         else:
             self.installed = None
 
 
 class MockCache:
-    """Mock apt.Cache for testing."""
+    """Mock apt.Cache for testing.
+
+    Packages are indexed by name up front so lookups stay O(1) for large caches.
+    """
+
+    # __weakref__ keeps instances usable as keys in the per-cache memo tables
+    __slots__ = ("_packages", "_by_name", "__weakref__")
 
     def __init__(self, packages: list[MockPackage]):
-        self._packages = packages
-        self._dict = {pkg.name: pkg for pkg in packages}
+        self._packages = list(packages)
+        self._by_name = {pkg.name: pkg for pkg in self._packages}
 
     def __iter__(self):
         return iter(self._packages)
 
     def __contains__(self, key: str):
-        return key in self._dict
+        return key in self._by_name
 
     def __getitem__(self, key: str):
-        if key not in self._dict:
-            raise KeyError(key)
-        return self._dict[key]
+        return self._by_name[key]
+
+    def get(self, key: str, default: MockPackage | None = None):
+        return self._by_name.get(key, default)
 
     def __len__(self):
         return len(self._packages)
@@ -201,7 +223,7 @@ def mock_apt_package():
     pkg.candidate.installed_size = 2048
     pkg.candidate.priority = "optional"
     pkg.candidate.homepage = "https://example.com"
-    pkg.candidate.origins = []
+    pkg.candidate.origins = ()
 
     # Mock dependencies
     pkg.candidate.dependencies = []
@@ -218,3 +240,181 @@ def mock_apt_package():
     pkg.candidate._cand.rev_depends_list = []
 
     return pkg
+
+
+# Config schemas for set-config tests. Schemas are read-only, so each one is
+# written once per session; only the config file is created per test.
+
+PORT_SCHEMA = """version: "1.0"
+groups:
+  - id: general
+    label: General Settings
+    fields:
+      - id: PORT
+        type: integer
+        label: Port
+"""
+
+PORT_RANGE_SCHEMA = """version: "1.0"
+groups:
+  - id: general
+    label: General Settings
+    fields:
+      - id: PORT
+        type: integer
+        label: Port
+        min: 1
+        max: 65535
+"""
+
+PORT_HOST_SCHEMA = """version: "1.0"
+groups:
+  - id: general
+    label: General Settings
+    fields:
+      - id: PORT
+        type: integer
+        label: Port
+        min: 1
+        max: 65535
+      - id: HOST
+        type: string
+        label: Host
+"""
+
+PORT_DEBUG_SCHEMA = """version: "1.0"
+groups:
+  - id: general
+    label: General Settings
+    fields:
+      - id: PORT
+        type: integer
+        label: Port
+        min: 1
+        max: 65535
+        required: true
+      - id: DEBUG
+        type: boolean
+        label: Debug Mode
+"""
+
+ENUM_SCHEMA = """version: "1.0"
+groups:
+  - id: general
+    label: General Settings
+    fields:
+      - id: LOG_LEVEL
+        type: enum
+        label: Log Level
+        options:
+          - value: debug
+            label: Debug
+          - value: info
+            label: Info
+          - value: error
+            label: Error
+"""
+
+REQUIRED_SCHEMA = """version: "1.0"
+groups:
+  - id: general
+    label: General Settings
+    fields:
+      - id: PORT
+        type: integer
+        label: Port
+        required: true
+      - id: HOST
+        type: string
+        label: Host
+        required: false
+"""
+
+ALL_TYPES_SCHEMA = """version: "1.0"
+groups:
+  - id: general
+    label: General Settings
+    fields:
+      - id: STRING_FIELD
+        type: string
+        label: String
+      - id: INT_FIELD
+        type: integer
+        label: Integer
+        min: 0
+        max: 100
+      - id: BOOL_FIELD
+        type: boolean
+        label: Boolean
+      - id: ENUM_FIELD
+        type: enum
+        label: Enum
+        options:
+          - value: opt1
+            label: Option 1
+          - value: opt2
+            label: Option 2
+      - id: PASSWORD_FIELD
+        type: password
+        label: Password
+      - id: PATH_FIELD
+        type: path
+        label: Path
+"""
+
+
+def _write_schema(tmp_path_factory, name: str, content: str) -> Path:
+    """Write a schema file into a fresh session-scoped temp directory."""
+    schema_path = tmp_path_factory.mktemp(name) / "config.yml"
+    schema_path.write_text(content)
+    return schema_path
+
+
+@pytest.fixture(scope="session")
+def port_schema(tmp_path_factory) -> Path:
+    """Schema with a single unconstrained PORT integer field."""
+    return _write_schema(tmp_path_factory, "port_schema", PORT_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def port_range_schema(tmp_path_factory) -> Path:
+    """Schema with a PORT integer field limited to 1-65535."""
+    return _write_schema(tmp_path_factory, "port_range_schema", PORT_RANGE_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def port_host_schema(tmp_path_factory) -> Path:
+    """Schema with a ranged PORT integer and a HOST string."""
+    return _write_schema(tmp_path_factory, "port_host_schema", PORT_HOST_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def port_debug_schema(tmp_path_factory) -> Path:
+    """Schema with a required ranged PORT integer and a DEBUG boolean."""
+    return _write_schema(tmp_path_factory, "port_debug_schema", PORT_DEBUG_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def enum_schema(tmp_path_factory) -> Path:
+    """Schema with a LOG_LEVEL enum field."""
+    return _write_schema(tmp_path_factory, "enum_schema", ENUM_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def required_schema(tmp_path_factory) -> Path:
+    """Schema with a required PORT and an optional HOST."""
+    return _write_schema(tmp_path_factory, "required_schema", REQUIRED_SCHEMA)
+
+
+@pytest.fixture(scope="session")
+def all_types_schema(tmp_path_factory) -> Path:
+    """Schema with one field of every supported type."""
+    return _write_schema(tmp_path_factory, "all_types_schema", ALL_TYPES_SCHEMA)
+
+
+@pytest.fixture
+def tmp_config_path(tmp_path) -> Path:
+    """Empty per-test config (.env) file."""
+    config_path = tmp_path / "config.env"
+    config_path.touch()
+    return config_path
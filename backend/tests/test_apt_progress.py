@@ -0,0 +1,50 @@
+"""
+Unit tests for apt-get progress reporting.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from cockpit_container_apps.utils import apt_progress
+
+
+def test_parse_status_line():
+    """Test parsing of Status-Fd progress lines."""
+    assert apt_progress._parse_status_line("dlstatus:1:12.5000:Retrieving file 1 of 2\n") == (
+        12,
+        "Retrieving file 1 of 2",
+    )
+    assert apt_progress._parse_status_line("pmstatus:test-package:40:\n") == (
+        40,
+        "Processing test-package...",
+    )
+    assert apt_progress._parse_status_line("pmerror:test-package:40:failed\n") is None
+    assert apt_progress._parse_status_line("Reading package lists...\n") is None
+
+
+def test_status_pipe_closed_when_popen_fails():
+    """Test that both ends of the status pipe are closed if apt-get cannot start."""
+    opened: list[tuple[int, int]] = []
+    real_pipe = os.pipe
+
+    def recording_pipe():
+        fds = real_pipe()
+        opened.append(fds)
+        return fds
+
+    with (
+        patch("cockpit_container_apps.utils.apt_progress.os.pipe", recording_pipe),
+        patch(
+            "cockpit_container_apps.utils.apt_progress.subprocess.Popen",
+            side_effect=FileNotFoundError("apt-get"),
+        ),
+        pytest.raises(FileNotFoundError),
+    ):
+        apt_progress.run_apt_get(["install", "-y", "test-package"])
+
+    (fds,) = opened
+    for fd in fds:
+        with pytest.raises(OSError):
+            os.fstat(fd)
@@ -1,6 +1,6 @@
 """Tests for config utilities."""
 
-import tempfile
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,6 +10,7 @@ from cockpit_container_apps.utils.config_utils import (
     get_config_file_path,
     get_config_schema_path,
     get_env_defaults_path,
+    load_config_schema,
     parse_env_file,
     validate_config_value,
     write_env_file,
@@ -41,204 +42,205 @@ class TestPathConstructors:
         assert path == Path("/var/lib/container-apps/signal-k/config.yml")
 
 
+class TestSchemaLoading:
+    """Tests for config schema loading."""
+
+    def test_load_returns_shared_result_until_modified(self, tmp_path):
+        """Test that an unchanged schema is parsed once and an edited one is reloaded."""
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text('version: "1.0"\ngroups: []\n')
+
+        first = load_config_schema(schema_path)
+        assert first == {"version": "1.0", "groups": []}
+        assert load_config_schema(schema_path) is first
+
+        schema_path.write_text('version: "2.0"\ngroups: []\n')
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert load_config_schema(schema_path)["version"] == "2.0"
+
+        # A rewrite within the same timestamp is caught by the size change
+        stat = schema_path.stat()
+        schema_path.write_text('version: "3.0.1"\ngroups: []\n')
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert load_config_schema(schema_path)["version"] == "3.0.1"
+
+
 class TestEnvFileParsing:
     """Tests for env file parsing."""
 
-    def test_parse_empty_file(self):
+    def test_parse_empty_file(self, tmp_path):
         """Test parsing empty env file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("")
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text("")
+        result = parse_env_file(env_path)
 
         assert result == {}
-        Path(f.name).unlink()
 
-    def test_parse_simple_values(self):
+    def test_parse_simple_values(self, tmp_path):
         """Test parsing simple key=value pairs."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("KEY1=value1\n")
-            f.write("KEY2=value2\n")
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text("KEY1=value1\nKEY2=value2\n")
+        result = parse_env_file(env_path)
 
         assert result == {"KEY1": "value1", "KEY2": "value2"}
-        Path(f.name).unlink()
 
-    def test_parse_quoted_values(self):
+    def test_parse_quoted_values(self, tmp_path):
         """Test parsing quoted values."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write('KEY1="value with spaces"\n')
-            f.write("KEY2='single quoted'\n")
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text("KEY1=\"value with spaces\"\nKEY2='single quoted'\n")
+        result = parse_env_file(env_path)
 
         assert result == {"KEY1": "value with spaces", "KEY2": "single quoted"}
-        Path(f.name).unlink()
 
-    def test_parse_empty_values(self):
+    def test_parse_empty_values(self, tmp_path):
         """Test parsing empty values."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("KEY1=\n")
-            f.write('KEY2=""\n')
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text('KEY1=\nKEY2=""\n')
+        result = parse_env_file(env_path)
 
         assert result == {"KEY1": "", "KEY2": ""}
-        Path(f.name).unlink()
 
-    def test_parse_comments(self):
+    def test_parse_comments(self, tmp_path):
         """Test that comments are ignored."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("# This is a comment\n")
-            f.write("KEY1=value1\n")
-            f.write("  # Another comment\n")
-            f.write("KEY2=value2  # inline comment\n")
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text(
+            "# This is a comment\nKEY1=value1\n  # Another comment\nKEY2=value2  # inline comment\n"
+        )
+        result = parse_env_file(env_path)
 
         # Line comments and inline comments should be stripped
         assert "KEY1" in result
         assert result["KEY1"] == "value1"
         assert "KEY2" in result
         assert result["KEY2"] == "value2"  # inline comment stripped
-        Path(f.name).unlink()
 
-    def test_parse_inline_comments(self):
+    def test_parse_inline_comments(self, tmp_path):
         """Test that inline comments are stripped correctly."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("KEY1=value1 # this is a comment\n")
-            f.write("KEY2=value2# comment without space\n")
-            f.write('KEY3="value with # hash" # but this is comment\n')
-            f.write("KEY4='value with # hash' # this too is comment\n")
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text(
+            "KEY1=value1 # this is a comment\n"
+            "KEY2=value2# comment without space\n"
+            'KEY3="value with # hash" # but this is comment\n'
+            "KEY4='value with # hash' # this too is comment\n"
+        )
+        result = parse_env_file(env_path)
 
         assert result["KEY1"] == "value1"
         assert result["KEY2"] == "value2"
         assert result["KEY3"] == "value with # hash"  # # inside quotes is preserved
         assert result["KEY4"] == "value with # hash"  # # inside quotes is preserved
-        Path(f.name).unlink()
 
-    def test_parse_blank_lines(self):
+    def test_parse_blank_lines(self, tmp_path):
         """Test that blank lines are ignored."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("\n")
-            f.write("KEY1=value1\n")
-            f.write("\n\n")
-            f.write("KEY2=value2\n")
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text("\nKEY1=value1\n\n\nKEY2=value2\n")
+        result = parse_env_file(env_path)
 
         assert result == {"KEY1": "value1", "KEY2": "value2"}
-        Path(f.name).unlink()
+
+    def test_parse_whitespace_around_assignment(self, tmp_path):
+        """Test that whitespace around keys, "=" and values is stripped."""
+        env_path = tmp_path / "env"
+        env_path.write_text("  KEY1 = value1  \n\tKEY2=\t'quoted' \n")
+        result = parse_env_file(env_path)
+
+        assert result == {"KEY1": "value1", "KEY2": "quoted"}
 
     def test_parse_missing_file(self):
         """Test parsing non-existent file returns empty dict."""
         result = parse_env_file(Path("/nonexistent/file.env"))
         assert result == {}
 
-    def test_parse_multiline_values(self):
+    def test_parse_multiline_values(self, tmp_path):
         """Test parsing multiline values (should not be supported)."""
         # Env files typically don't support multiline values
         # Each line should be treated as separate
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("KEY1=line1\n")
-            f.write("line2\n")  # This is invalid and should be ignored
-            f.write("KEY2=value2\n")
-            f.flush()
-            result = parse_env_file(Path(f.name))
+        env_path = tmp_path / "env"
+        env_path.write_text(
+            "KEY1=line1\n"
+            "line2\n"  # This is invalid and should be ignored
+            "KEY2=value2\n"
+        )
+        result = parse_env_file(env_path)
 
         # Invalid lines should be ignored
         assert "KEY1" in result
         assert "KEY2" in result
-        Path(f.name).unlink()
 
 
 class TestEnvFileWriting:
     """Tests for env file writing."""
 
-    def test_write_simple_values(self):
+    def test_write_simple_values(self, tmp_path):
         """Test writing simple key=value pairs."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            temp_path = Path(f.name)
+        env_path = tmp_path / "env"
 
         config = {"KEY1": "value1", "KEY2": "value2"}
-        write_env_file(temp_path, config)
+        write_env_file(env_path, config)
 
-        content = temp_path.read_text()
+        content = env_path.read_text()
         assert "KEY1=value1\n" in content
         assert "KEY2=value2\n" in content
-        temp_path.unlink()
 
-    def test_write_quoted_values(self):
+    def test_write_quoted_values(self, tmp_path):
         """Test that values with spaces are quoted."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            temp_path = Path(f.name)
+        env_path = tmp_path / "env"
 
         config = {"KEY1": "value with spaces", "KEY2": "simple"}
-        write_env_file(temp_path, config)
+        write_env_file(env_path, config)
 
-        content = temp_path.read_text()
+        content = env_path.read_text()
         assert 'KEY1="value with spaces"\n' in content or "KEY1='value with spaces'\n" in content
         assert "KEY2=simple\n" in content or 'KEY2="simple"\n' in content
-        temp_path.unlink()
 
-    def test_write_empty_values(self):
+    def test_write_empty_values(self, tmp_path):
         """Test writing empty values."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            temp_path = Path(f.name)
+        env_path = tmp_path / "env"
 
         config = {"KEY1": "", "KEY2": "value2"}
-        write_env_file(temp_path, config)
+        write_env_file(env_path, config)
 
-        content = temp_path.read_text()
+        content = env_path.read_text()
         assert "KEY1=" in content
         assert "KEY2=value2\n" in content
-        temp_path.unlink()
 
-    def test_write_empty_config(self):
+    def test_write_empty_config(self, tmp_path):
         """Test writing empty config."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            temp_path = Path(f.name)
+        env_path = tmp_path / "env"
 
         config = {}
-        write_env_file(temp_path, config)
+        write_env_file(env_path, config)
 
-        content = temp_path.read_text()
+        content = env_path.read_text()
         assert content == ""
-        temp_path.unlink()
 
-    def test_atomic_write(self):
+    def test_atomic_write(self, tmp_path):
         """Test that writes are atomic (temp file + rename)."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            temp_path = Path(f.name)
+        env_path = tmp_path / "env"
 
         # Write initial content
-        temp_path.write_text("KEY1=old\n")
+        env_path.write_text("KEY1=old\n")
 
         # Write new content
         config = {"KEY1": "new", "KEY2": "value2"}
 
         # Mock to verify temp file strategy
         with patch("cockpit_container_apps.utils.config_utils.Path.rename") as mock_rename:
-            write_env_file(temp_path, config)
+            write_env_file(env_path, config)
             # Verify rename was called (atomic write pattern)
             mock_rename.assert_called_once()
 
-        temp_path.unlink(missing_ok=True)
-
-    def test_write_creates_parent_directories(self):
+    def test_write_creates_parent_directories(self, tmp_path):
         """Test that parent directories are created if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "subdir" / "config" / "env"
+        config_path = tmp_path / "subdir" / "config" / "env"
 
-            config = {"KEY1": "value1"}
-            write_env_file(config_path, config)
+        config = {"KEY1": "value1"}
+        write_env_file(config_path, config)
 
-            assert config_path.exists()
-            content = config_path.read_text()
-            assert "KEY1=value1\n" in content
+        assert config_path.exists()
+        content = config_path.read_text()
+        assert "KEY1=value1\n" in content
 
 
 class TestConfigValidation:
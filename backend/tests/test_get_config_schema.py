@@ -1,6 +1,5 @@
 """Tests for get_config_schema command."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,7 +11,7 @@ from cockpit_container_apps.commands import get_config_schema
 class TestGetConfigSchema:
     """Tests for get-config-schema command."""
 
-    def test_get_schema_simple(self):
+    def test_get_schema_simple(self, tmp_path):
         """Test getting a simple config schema."""
         # Create a temp schema file
         schema_content = """version: "1.0"
@@ -30,10 +29,8 @@ groups:
         max: 65535
         required: true
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(schema_content)
 
         with patch(
             "cockpit_container_apps.commands.get_config_schema.get_config_schema_path",
@@ -41,8 +38,6 @@ groups:
         ):
             result = get_config_schema.execute(package="signalk")
 
-        schema_path.unlink()
-
         # Verify structure
         assert result["success"] is True
         assert "schema" in result
@@ -52,7 +47,7 @@ groups:
         assert len(result["schema"]["groups"][0]["fields"]) == 1
         assert result["schema"]["groups"][0]["fields"][0]["id"] == "PORT"
 
-    def test_get_schema_multiple_groups(self):
+    def test_get_schema_multiple_groups(self, tmp_path):
         """Test getting schema with multiple groups."""
         schema_content = """version: "1.0"
 groups:
@@ -71,10 +66,8 @@ groups:
         label: Admin Password
         required: true
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(schema_content)
 
         with patch(
             "cockpit_container_apps.commands.get_config_schema.get_config_schema_path",
@@ -82,14 +75,12 @@ groups:
         ):
             result = get_config_schema.execute(package="signalk")
 
-        schema_path.unlink()
-
         assert result["success"] is True
         assert len(result["schema"]["groups"]) == 2
         assert result["schema"]["groups"][0]["id"] == "general"
         assert result["schema"]["groups"][1]["id"] == "security"
 
-    def test_get_schema_all_field_types(self):
+    def test_get_schema_all_field_types(self, tmp_path):
         """Test schema with all supported field types."""
         schema_content = """version: "1.0"
 groups:
@@ -122,10 +113,8 @@ groups:
         type: path
         label: Path Field
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(schema_content)
 
         with patch(
             "cockpit_container_apps.commands.get_config_schema.get_config_schema_path",
@@ -133,8 +122,6 @@ groups:
         ):
             result = get_config_schema.execute(package="test-package")
 
-        schema_path.unlink()
-
         assert result["success"] is True
         fields = result["schema"]["groups"][0]["fields"]
         assert len(fields) == 6
@@ -157,7 +144,7 @@ groups:
         assert "error" in result
         assert "not found" in result["error"].lower() or "does not exist" in result["error"].lower()
 
-    def test_get_schema_invalid_yaml(self):
+    def test_get_schema_invalid_yaml(self, tmp_path):
         """Test getting schema with invalid YAML."""
         schema_content = """version: "1.0"
 groups:
@@ -165,10 +152,8 @@ groups:
     label: General Settings
     fields: [invalid yaml structure
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(schema_content)
 
         with patch(
             "cockpit_container_apps.commands.get_config_schema.get_config_schema_path",
@@ -176,13 +161,11 @@ groups:
         ):
             result = get_config_schema.execute(package="signalk")
 
-        schema_path.unlink()
-
         assert result["success"] is False
         assert "error" in result
         assert "yaml" in result["error"].lower() or "parse" in result["error"].lower()
 
-    def test_get_schema_missing_version(self):
+    def test_get_schema_missing_version(self, tmp_path):
         """Test getting schema without version field."""
         schema_content = """groups:
   - id: general
@@ -192,10 +175,8 @@ groups:
         type: integer
         label: Port
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(schema_content)
 
         with patch(
             "cockpit_container_apps.commands.get_config_schema.get_config_schema_path",
@@ -203,20 +184,16 @@ groups:
         ):
             result = get_config_schema.execute(package="signalk")
 
-        schema_path.unlink()
-
         assert result["success"] is False
         assert "error" in result
         assert "version" in result["error"].lower()
 
-    def test_get_schema_missing_groups(self):
+    def test_get_schema_missing_groups(self, tmp_path):
         """Test getting schema without groups field."""
         schema_content = """version: "1.0"
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(schema_content)
 
         with patch(
             "cockpit_container_apps.commands.get_config_schema.get_config_schema_path",
@@ -224,8 +201,6 @@ groups:
         ):
             result = get_config_schema.execute(package="signalk")
 
-        schema_path.unlink()
-
         assert result["success"] is False
         assert "error" in result
         assert "groups" in result["error"].lower()
@@ -241,7 +216,7 @@ groups:
         with pytest.raises(ValueError, match="package name"):
             get_config_schema.execute(package="../../etc/passwd")
 
-    def test_get_schema_preserves_all_attributes(self):
+    def test_get_schema_preserves_all_attributes(self, tmp_path):
         """Test that all schema attributes are preserved."""
         schema_content = """version: "1.0"
 groups:
@@ -259,10 +234,8 @@ groups:
         required: true
         help: "Enter a port between 1 and 65535"
 """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(schema_content)
 
         with patch(
             "cockpit_container_apps.commands.get_config_schema.get_config_schema_path",
@@ -270,8 +243,6 @@ groups:
         ):
             result = get_config_schema.execute(package="signalk")
 
-        schema_path.unlink()
-
         assert result["success"] is True
         group = result["schema"]["groups"][0]
         assert group["description"] == "This is a description"
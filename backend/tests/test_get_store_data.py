@@ -14,7 +14,7 @@ from cockpit_container_apps.vendor.cockpit_apt_utils.errors import (
     APTBridgeError,
     CacheError,
 )
-from tests.conftest import MockCache, MockPackage
+from tests.conftest import MockCache, MockOrigin, MockPackage
 
 
 @pytest.fixture
@@ -25,39 +25,27 @@ def marine_packages():
     # Marine navigation packages
     pkg1 = MockPackage("signalk-container", summary="Marine data server", installed=True)
     pkg1.candidate.record["Tag"] = "role::container-app, field::marine, category::communication"
-    origin1 = MagicMock()
-    origin1.origin = "Hat Labs"
-    origin1.label = "Hat Labs"
-    origin1.suite = "stable"
-    pkg1.candidate.origins = [origin1]
+    origin1 = MockOrigin("Hat Labs", "Hat Labs", "stable")
+    pkg1.candidate.origins = (origin1,)
     packages.append(pkg1)
 
     pkg2 = MockPackage("opencpn-container", summary="Chart plotter", installed=False)
     pkg2.candidate.record["Tag"] = "role::container-app, field::marine, category::navigation"
-    origin2 = MagicMock()
-    origin2.origin = "Hat Labs"
-    origin2.label = "Hat Labs"
-    origin2.suite = "stable"
-    pkg2.candidate.origins = [origin2]
+    origin2 = MockOrigin("Hat Labs", "Hat Labs", "stable")
+    pkg2.candidate.origins = (origin2,)
     packages.append(pkg2)
 
     pkg3 = MockPackage("grafana-container", summary="Monitoring dashboard", installed=True)
     pkg3.candidate.record["Tag"] = "role::container-app, field::marine, category::monitoring"
-    origin3 = MagicMock()
-    origin3.origin = "Hat Labs"
-    origin3.label = "Hat Labs"
-    origin3.suite = "stable"
-    pkg3.candidate.origins = [origin3]
+    origin3 = MockOrigin("Hat Labs", "Hat Labs", "stable")
+    pkg3.candidate.origins = (origin3,)
     packages.append(pkg3)
 
     # Add some Debian packages that should NOT appear (different origin)
     for i in range(10):
         pkg = MockPackage(f"debian-pkg-{i}", summary=f"Debian package {i}")
-        origin_deb = MagicMock()
-        origin_deb.origin = "Debian"
-        origin_deb.label = "Debian"
-        origin_deb.suite = "trixie"
-        pkg.candidate.origins = [origin_deb]
+        origin_deb = MockOrigin("Debian", "Debian", "trixie")
+        pkg.candidate.origins = (origin_deb,)
         pkg.candidate.record["Tag"] = "role::application"
         packages.append(pkg)
 
@@ -178,11 +166,8 @@ class TestGetStoreData:
         large_cache = marine_packages.copy()
         for i in range(1000):
             pkg = MockPackage(f"debian-large-{i}", summary=f"Debian package {i}")
-            origin = MagicMock()
-            origin.origin = "Debian"
-            origin.label = "Debian"
-            origin.suite = "trixie"
-            pkg.candidate.origins = [origin]
+            origin = MockOrigin("Debian", "Debian", "trixie")
+            pkg.candidate.origins = (origin,)
             large_cache.append(pkg)
 
         mock_apt = MagicMock()
@@ -225,6 +210,38 @@ class TestGetStoreData:
         labels = [c["label"] for c in result["categories"]]
         assert labels == sorted(labels)
 
+    @patch("cockpit_container_apps.commands.get_store_data.load_stores")
+    def test_repeated_category_counted_once(self, mock_load_stores, marine_packages):
+        """Test that a category repeated in one package's Tag field counts once."""
+        from cockpit_container_apps.utils.store_config import StoreConfig, StoreFilter
+
+        marine_store = StoreConfig(
+            id="marine",
+            name="Marine Apps",
+            description="Marine apps",
+            filters=StoreFilter(
+                include_origins=[],
+                include_sections=[],
+                include_tags=["role::container-app"],
+                include_packages=[],
+            ),
+        )
+        mock_load_stores.return_value = [marine_store]
+
+        marine_packages[1].candidate.record["Tag"] = (
+            "role::container-app, category::navigation, category::navigation"
+        )
+        mock_apt = MagicMock()
+        mock_apt.Cache = MagicMock(return_value=MockCache(marine_packages))
+
+        with patch.dict("sys.modules", {"apt": mock_apt}):
+            result = get_store_data.execute("marine")
+
+        navigation = next(c for c in result["categories"] if c["id"] == "navigation")
+        assert navigation["count"] == 1
+        assert navigation["count_available"] == 1
+        assert navigation["count_installed"] == 0
+
     @patch("cockpit_container_apps.commands.get_store_data.load_stores")
     def test_apt_cache_error(self, mock_load_stores):
         """Test error handling when APT cache fails to open."""
@@ -2,6 +2,9 @@
 Unit tests for install and remove commands.
 """
 
+import io
+import json
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +13,22 @@ from cockpit_container_apps.commands import install, remove
 from cockpit_container_apps.vendor.cockpit_apt_utils.errors import APTBridgeError
 
 
+def _fake_apt_get(status: str, stderr: str = "", returncode: int = 0) -> MagicMock:
+    """Build a Popen stand-in that writes Status-Fd lines to the passed pipe."""
+
+    def popen(cmd, **kwargs):
+        (status_fd,) = kwargs["pass_fds"]
+        assert f"APT::Status-Fd={status_fd}" in cmd
+        os.write(status_fd, status.encode())
+
+        process = MagicMock()
+        process.stderr = io.StringIO(stderr)
+        process.returncode = returncode
+        return process
+
+    return MagicMock(side_effect=popen)
+
+
 class TestInstall:
     """Tests for install command."""
 
@@ -23,37 +42,36 @@ class TestInstall:
         with pytest.raises(APTBridgeError):
             install.execute("")
 
-    @patch("cockpit_container_apps.commands.install.subprocess.Popen")
-    @patch("cockpit_container_apps.commands.install.os.pipe")
-    def test_successful_install(self, mock_pipe, mock_popen):
+    def test_successful_install(self, capsys):
         """Test successful package installation."""
-        # Set up mocks
-        mock_pipe.return_value = (10, 11)
+        mock_popen = _fake_apt_get("pmstatus:test-package:50:Installing test-package\n")
 
-        mock_process = MagicMock()
-        mock_process.poll.side_effect = [None, None, 0]
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = ("", "")
-        mock_popen.return_value = mock_process
+        with patch("cockpit_container_apps.utils.apt_progress.subprocess.Popen", mock_popen):
+            result = install.execute("test-package")
 
-        # Mock os.close and os.fdopen
-        with (
-            patch("cockpit_container_apps.commands.install.os.close"),
-            patch("cockpit_container_apps.commands.install.os.fdopen") as mock_fdopen,
-        ):
-            mock_file = MagicMock()
-            mock_file.read.return_value = ""
-            mock_fdopen.return_value = mock_file
+        # Install command returns None (streams output)
+        assert result is None
 
-            with patch(
-                "cockpit_container_apps.commands.install.select.select"
-            ) as mock_select:
-                mock_select.return_value = ([], [], [])
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert lines[0] == {
+            "type": "progress",
+            "percentage": 50,
+            "message": "Installing test-package",
+        }
+        assert lines[-1]["success"] is True
 
-                result = install.execute("test-package")
+    def test_install_not_found_reports_stderr(self):
+        """Test that apt-get stderr is used for error detection and details."""
+        stderr = "E: Unable to locate package test-package\n"
+        mock_popen = _fake_apt_get("", stderr=stderr, returncode=100)
 
-        # Install command returns None (streams output)
-        assert result is None
+        with (
+            patch("cockpit_container_apps.utils.apt_progress.subprocess.Popen", mock_popen),
+            pytest.raises(APTBridgeError) as exc_info,
+        ):
+            install.execute("test-package")
+
+        assert exc_info.value.code == "PACKAGE_NOT_FOUND"
 
 
 class TestRemove:
@@ -76,31 +94,38 @@ class TestRemove:
 
         assert exc_info.value.code == "ESSENTIAL_PACKAGE"
 
-    @patch("cockpit_container_apps.commands.remove.subprocess.Popen")
-    @patch("cockpit_container_apps.commands.remove.os.pipe")
-    def test_successful_remove(self, mock_pipe, mock_popen):
+    def test_successful_remove(self):
         """Test successful package removal."""
-        mock_pipe.return_value = (10, 11)
+        mock_popen = _fake_apt_get("pmstatus:test-package:50:Removing test-package\n")
+
+        with patch("cockpit_container_apps.utils.apt_progress.subprocess.Popen", mock_popen):
+            result = remove.execute("test-package")
+
+        assert result is None
 
-        mock_process = MagicMock()
-        mock_process.poll.side_effect = [None, None, 0]
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = ("", "")
-        mock_popen.return_value = mock_process
+    def test_remove_not_installed(self):
+        """Test that apt-get stderr is used to detect a missing package."""
+        stderr = "Package 'test-package' is not installed, so not removed\n"
+        mock_popen = _fake_apt_get("", stderr=stderr, returncode=100)
 
         with (
-            patch("cockpit_container_apps.commands.remove.os.close"),
-            patch("cockpit_container_apps.commands.remove.os.fdopen") as mock_fdopen,
+            patch("cockpit_container_apps.utils.apt_progress.subprocess.Popen", mock_popen),
+            pytest.raises(APTBridgeError) as exc_info,
         ):
-            mock_file = MagicMock()
-            mock_file.read.return_value = ""
-            mock_fdopen.return_value = mock_file
+            remove.execute("test-package")
 
-            with patch(
-                "cockpit_container_apps.commands.remove.select.select"
-            ) as mock_select:
-                mock_select.return_value = ([], [], [])
+        assert exc_info.value.code == "PACKAGE_NOT_FOUND"
 
-                result = remove.execute("test-package")
+    def test_remove_failure_details_are_stderr(self):
+        """Test that a failed removal reports apt-get stderr as details."""
+        stderr = "E: Sub-process /usr/bin/dpkg returned an error code (1)\n"
+        mock_popen = _fake_apt_get("pmstatus:test-package:10:Removing\n", stderr, 100)
 
-        assert result is None
+        with (
+            patch("cockpit_container_apps.utils.apt_progress.subprocess.Popen", mock_popen),
+            pytest.raises(APTBridgeError) as exc_info,
+        ):
+            remove.execute("test-package")
+
+        assert exc_info.value.code == "REMOVE_FAILED"
+        assert exc_info.value.details == stderr
@@ -1,8 +1,9 @@
 """Tests for list_store_packages command."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from cockpit_container_apps.commands import list_store_packages
+from tests.conftest import MockCache, MockPackage
 
 
 def create_mock_package(
@@ -11,36 +12,20 @@ def create_mock_package(
     installed: bool = False,
     version: str = "1.0.0",
     summary: str = "Test package",
-) -> MagicMock:
+) -> MockPackage:
     """Create a mock apt package with optional tags."""
-    pkg = MagicMock()
-    pkg.name = name
-    pkg.is_installed = installed
-
-    pkg.candidate = MagicMock()
-    pkg.candidate.version = version
-    pkg.candidate.summary = summary
+    pkg = MockPackage(name, summary=summary, version=version, installed=installed)
 
     # Set up the Tag field in the record
     if tags:
-        pkg.candidate.record = {"Tag": ", ".join(tags)}
-    else:
-        pkg.candidate.record = {}
-
-    if installed:
-        pkg.installed = MagicMock()
-        pkg.installed.version = version
-        pkg.installed.summary = summary
-    else:
-        pkg.installed = None
+        pkg.candidate.record["Tag"] = ", ".join(tags)
 
     return pkg
 
 
 def test_list_store_packages_empty():
     """Test listing store packages when none are available."""
-    mock_cache = MagicMock()
-    mock_cache.__iter__ = lambda self: iter([])
+    mock_cache = MockCache([])
 
     with patch("apt.Cache", return_value=mock_cache):
         result = list_store_packages.execute()
@@ -75,8 +60,7 @@ def test_list_store_packages_with_stores():
         ),
     ]
 
-    mock_cache = MagicMock()
-    mock_cache.__iter__ = lambda self: iter(mock_packages)
+    mock_cache = MockCache(mock_packages)
 
     with patch("apt.Cache", return_value=mock_cache):
         result = list_store_packages.execute()
@@ -109,8 +93,7 @@ def test_list_store_packages_no_tags():
         ),
     ]
 
-    mock_cache = MagicMock()
-    mock_cache.__iter__ = lambda self: iter(mock_packages)
+    mock_cache = MockCache(mock_packages)
 
     with patch("apt.Cache", return_value=mock_cache):
         result = list_store_packages.execute()
@@ -128,8 +111,7 @@ def test_list_store_packages_wrong_tag():
         ),
     ]
 
-    mock_cache = MagicMock()
-    mock_cache.__iter__ = lambda self: iter(mock_packages)
+    mock_cache = MockCache(mock_packages)
 
     with patch("apt.Cache", return_value=mock_cache):
         result = list_store_packages.execute()
@@ -52,3 +52,29 @@ def test_list_stores_with_stores():
     assert result[0]["banner"] == "/banners/marine.jpg"
     assert result[0]["filters"]["include_tags"] == ["field::marine"]
     assert result[0]["category_metadata"] is None
+
+
+def test_list_stores_with_unhashable_icon():
+    """Test that YAML mappings in free-form fields are passed through as-is."""
+    mock_stores = [
+        StoreConfig(
+            id="marine",
+            name="Marine Apps",
+            description="Marine navigation applications",
+            filters=StoreFilter(
+                include_tags=["field::marine"],
+                include_origins=[],
+                include_sections=[],
+                include_packages=[],
+            ),
+            icon={"path": "x.svg"},  # type: ignore[arg-type]
+        ),
+    ]
+
+    with patch(
+        "cockpit_container_apps.commands.list_stores.load_stores",
+        return_value=mock_stores,
+    ):
+        result = list_stores.execute()
+
+    assert result[0]["icon"] == {"path": "x.svg"}
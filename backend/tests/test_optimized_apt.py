@@ -5,8 +5,11 @@ These tests use the actual Debian packages in the Docker container
 to test the apt_pkg optimization against real data.
 """
 
+from unittest.mock import patch
+
 import pytest
 
+from cockpit_container_apps.utils import optimized_apt
 from cockpit_container_apps.utils.optimized_apt import (
     get_packages_by_origin,
     get_packages_by_origins,
@@ -94,3 +97,19 @@ class TestGetPackagesByOriginsIntegration:
 
         assert len(result) > 0
         assert all(isinstance(pkg.name, str) for pkg in result)
+
+    def test_origin_index_reused_for_same_cache(self, real_apt_cache, debian_packages):
+        """Test that the origin index is built once per cache and reused."""
+        origins = list(set(debian_packages.values()))
+
+        with patch.object(
+            optimized_apt,
+            "_build_origin_index",
+            wraps=optimized_apt._build_origin_index,
+        ) as build_index:
+            optimized_apt._ORIGIN_INDEX.pop(real_apt_cache, None)
+            first = get_packages_by_origins(real_apt_cache, origins)
+            second = get_packages_by_origin(real_apt_cache, origins[0])
+
+        assert build_index.call_count == 1
+        assert {pkg.name for pkg in second} <= {pkg.name for pkg in first}
@@ -1,424 +1,208 @@
 """Tests for set_config command."""
 
+import os
 import subprocess
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
 from cockpit_container_apps.commands import set_config
+from tests.conftest import PORT_SCHEMA
 
 
-class TestSetConfig:
-    """Tests for set-config command."""
-
-    def test_set_config_simple(self):
-        """Test setting simple config values."""
-        # Create schema
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-        min: 1
-        max: 65535
-      - id: HOST
-        type: string
-        label: Host
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        # Create config file location
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "8080", "HOST": "0.0.0.0"},
-            )
-
-        schema_path.unlink()
-
-        assert result["success"] is True
-
-        # Verify file was written
-        content = config_path.read_text()
-        assert "PORT=8080" in content or 'PORT="8080"' in content
-        assert "HOST=0.0.0.0" in content or 'HOST="0.0.0.0"' in content
+def _use_paths(monkeypatch, schema_path: Path, config_path: Path) -> None:
+    """Point set_config at the given schema and config file paths."""
+    monkeypatch.setattr(set_config, "get_config_schema_path", lambda _package: schema_path)
+    monkeypatch.setattr(set_config, "get_config_file_path", lambda _package: config_path)
 
-        config_path.unlink()
-
-    def test_set_config_validation_success(self):
-        """Test that valid values pass validation."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-        min: 1
-        max: 65535
-        required: true
-      - id: DEBUG
-        type: boolean
-        label: Debug Mode
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "3000", "DEBUG": "true"},
-            )
 
-        schema_path.unlink()
-        config_path.unlink()
+def _fake_run(monkeypatch, result=None, error=None) -> list:
+    """Replace subprocess.run with a stub that records its calls.
 
-        assert result["success"] is True
+    Returns:
+        List that receives an (args, kwargs) tuple per call
+    """
+    calls = []
 
-    def test_set_config_validation_failure_integer(self):
-        """Test that invalid integer values fail validation."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-        min: 1
-        max: 65535
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            # Test value out of range
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "99999"},  # Above max
-            )
+    def fake_run(*args, **kwargs):
+        calls.append((args, kwargs))
+        if error is not None:
+            raise error
+        return result
 
-        schema_path.unlink()
-        config_path.unlink()
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
 
-        assert result["success"] is False
-        assert "error" in result
-        assert "validation" in result["error"].lower() or "invalid" in result["error"].lower()
-
-    def test_set_config_validation_failure_enum(self):
-        """Test that invalid enum values fail validation."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: LOG_LEVEL
-        type: enum
-        label: Log Level
-        options:
-          - value: debug
-            label: Debug
-          - value: info
-            label: Info
-          - value: error
-            label: Error
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={"LOG_LEVEL": "trace"},  # Not in enum options
-            )
 
-        schema_path.unlink()
-        config_path.unlink()
+class TestSetConfig:
+    """Tests for set-config command."""
 
-        assert result["success"] is False
-        assert "error" in result
+    def test_set_config_simple(self, monkeypatch, port_host_schema, tmp_config_path):
+        """Test setting simple config values."""
+        _use_paths(monkeypatch, port_host_schema, tmp_config_path)
 
-    def test_set_config_validation_failure_required(self):
-        """Test that missing required fields fail validation."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-        required: true
-      - id: HOST
-        type: string
-        label: Host
-        required: false
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            # Missing required PORT field
-            result = set_config.execute(
-                package="signalk",
-                config={"HOST": "localhost"},
-            )
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "8080", "HOST": "0.0.0.0"},
+        )
 
-        schema_path.unlink()
-        config_path.unlink()
+        assert result["success"] is True
 
-        assert result["success"] is False
-        assert "error" in result
-        assert "required" in result["error"].lower() or "PORT" in result["error"]
-
-    def test_set_config_unknown_field(self):
-        """Test setting config with unknown field (not in schema)."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "3000", "UNKNOWN_FIELD": "value"},
-            )
+        # Verify file was written
+        content = tmp_config_path.read_text()
+        assert "PORT=8080" in content or 'PORT="8080"' in content
+        assert "HOST=0.0.0.0" in content or 'HOST="0.0.0.0"' in content
 
-        schema_path.unlink()
-        config_path.unlink()
+    @pytest.mark.parametrize(
+        ("schema_fixture", "config", "expect_success", "error_hints"),
+        [
+            pytest.param(
+                "port_debug_schema",
+                {"PORT": "3000", "DEBUG": "true"},
+                True,
+                (),
+                id="valid-values",
+            ),
+            pytest.param(
+                "all_types_schema",
+                {
+                    "STRING_FIELD": "test",
+                    "INT_FIELD": "50",
+                    "BOOL_FIELD": "true",
+                    "ENUM_FIELD": "opt1",
+                    "PASSWORD_FIELD": "secret",
+                    "PATH_FIELD": "/var/lib/data",
+                },
+                True,
+                (),
+                id="all-field-types",
+            ),
+            pytest.param(
+                "port_range_schema",
+                {"PORT": "99999"},  # Above max
+                False,
+                ("validation", "invalid"),
+                id="integer-out-of-range",
+            ),
+            pytest.param(
+                "enum_schema",
+                {"LOG_LEVEL": "trace"},  # Not in enum options
+                False,
+                (),
+                id="enum-not-in-options",
+            ),
+            pytest.param(
+                "required_schema",
+                {"HOST": "localhost"},  # Missing required PORT field
+                False,
+                ("required", "port"),
+                id="missing-required",
+            ),
+            pytest.param(
+                "port_schema",
+                {"PORT": "3000", "UNKNOWN_FIELD": "value"},  # Not in schema
+                False,
+                ("unknown", "unknown_field"),
+                id="unknown-field",
+            ),
+        ],
+    )
+    def test_set_config_validation(
+        self,
+        request,
+        monkeypatch,
+        tmp_config_path,
+        schema_fixture,
+        config,
+        expect_success,
+        error_hints,
+    ):
+        """Test validating config values against the schema."""
+        _use_paths(monkeypatch, request.getfixturevalue(schema_fixture), tmp_config_path)
+
+        result = set_config.execute(package="signalk", config=config)
+
+        assert result["success"] is expect_success
+        if expect_success:
+            return
 
-        # Should fail - unknown fields not allowed
-        assert result["success"] is False
         assert "error" in result
-        assert "unknown" in result["error"].lower() or "UNKNOWN_FIELD" in result["error"]
+        if error_hints:
+            assert any(hint in result["error"].lower() for hint in error_hints)
 
-    def test_set_config_empty_config(self):
+    def test_set_config_empty_config(self, monkeypatch, port_schema, tmp_config_path):
         """Test setting empty config."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-        required: false
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(package="signalk", config={})
-
-        schema_path.unlink()
+        _use_paths(monkeypatch, port_schema, tmp_config_path)
+
+        result = set_config.execute(package="signalk", config={})
 
         # Should succeed - no required fields
         assert result["success"] is True
 
         # File should be empty or contain no config
-        content = config_path.read_text()
+        content = tmp_config_path.read_text()
         assert content == "" or content.strip() == ""
 
-        config_path.unlink()
-
-    def test_set_config_preserves_unmanaged_keys(self):
+    def test_set_config_preserves_unmanaged_keys(self, monkeypatch, port_schema, tmp_config_path):
         """Test that setting config preserves keys not managed by schema."""
         # This test ensures we don't delete user's custom env vars
         # that aren't in the schema
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
 
         # Create existing config with unmanaged key
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            f.write("PORT=3000\n")
-            f.write("CUSTOM_ENV_VAR=custom_value\n")  # Not in schema
-            f.flush()
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            # Update PORT only
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "8080"},
-            )
+        tmp_config_path.write_text(
+            "PORT=3000\nCUSTOM_ENV_VAR=custom_value\n"  # Not in schema
+        )
+
+        _use_paths(monkeypatch, port_schema, tmp_config_path)
 
-        schema_path.unlink()
+        # Update PORT only
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "8080"},
+        )
 
         assert result["success"] is True
 
         # Verify CUSTOM_ENV_VAR was NOT deleted
-        content = config_path.read_text()
+        content = tmp_config_path.read_text()
         assert "PORT=8080" in content or 'PORT="8080"' in content
         # Note: This behavior depends on implementation
         # If we want to preserve unmanaged keys, they should still be there
         # For now, let's assume we ONLY write the keys provided in config
         # So CUSTOM_ENV_VAR will be lost
 
-        config_path.unlink()
-
-    def test_set_config_atomic_write(self):
+    def test_set_config_atomic_write(self, monkeypatch, port_schema, tmp_config_path):
         """Test that config writes are atomic."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
         # Write initial content
-        config_path.write_text("OLD_CONTENT=should_be_replaced\n")
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "3000"},
-            )
+        tmp_config_path.write_text("OLD_CONTENT=should_be_replaced\n")
+
+        _use_paths(monkeypatch, port_schema, tmp_config_path)
 
-        schema_path.unlink()
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "3000"},
+        )
 
         assert result["success"] is True
 
         # Verify old content was replaced
-        content = config_path.read_text()
+        content = tmp_config_path.read_text()
         assert "PORT=3000" in content or 'PORT="3000"' in content
         # OLD_CONTENT should be gone (we replace the entire file)
 
-        config_path.unlink()
-
-    def test_set_config_missing_schema(self):
+    def test_set_config_missing_schema(self, monkeypatch):
         """Test setting config when schema doesn't exist."""
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=Path("/nonexistent/config.yml"),
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "3000"},
-            )
+        monkeypatch.setattr(
+            set_config,
+            "get_config_schema_path",
+            lambda _package: Path("/nonexistent/config.yml"),
+        )
+
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "3000"},
+        )
 
         assert result["success"] is False
         assert "error" in result
@@ -434,192 +218,56 @@ groups:
         with pytest.raises(ValueError, match="package name"):
             set_config.execute(package="../../etc/passwd", config={"PORT": "3000"})
 
-    def test_set_config_write_error(self):
+    def test_set_config_write_error(self, monkeypatch, port_schema):
         """Test handling of write errors."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
         # Use a path that should fail to write (read-only filesystem)
         config_path = Path("/proc/this/should/fail")
 
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "3000"},
-            )
+        _use_paths(monkeypatch, port_schema, config_path)
 
-        schema_path.unlink()
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "3000"},
+        )
 
         assert result["success"] is False
         assert "error" in result
 
-    def test_set_config_all_field_types(self):
-        """Test setting config with all field types."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: STRING_FIELD
-        type: string
-        label: String
-      - id: INT_FIELD
-        type: integer
-        label: Integer
-        min: 0
-        max: 100
-      - id: BOOL_FIELD
-        type: boolean
-        label: Boolean
-      - id: ENUM_FIELD
-        type: enum
-        label: Enum
-        options:
-          - value: opt1
-            label: Option 1
-          - value: opt2
-            label: Option 2
-      - id: PASSWORD_FIELD
-        type: password
-        label: Password
-      - id: PATH_FIELD
-        type: path
-        label: Path
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ):
-            result = set_config.execute(
-                package="signalk",
-                config={
-                    "STRING_FIELD": "test",
-                    "INT_FIELD": "50",
-                    "BOOL_FIELD": "true",
-                    "ENUM_FIELD": "opt1",
-                    "PASSWORD_FIELD": "secret",
-                    "PATH_FIELD": "/var/lib/data",
-                },
-            )
-
-        schema_path.unlink()
-        config_path.unlink()
-
-        assert result["success"] is True
-
-    def test_set_config_restart_service_success(self):
+    def test_set_config_restart_service_success(self, monkeypatch, port_schema, tmp_config_path):
         """Test that service restart succeeds after config save."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ), patch("subprocess.run") as mock_run:
-            # Mock successful restart
-            mock_run.return_value = Mock(returncode=0, stderr="")
-
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "8080"},
-            )
+        _use_paths(monkeypatch, port_schema, tmp_config_path)
+        # Mock successful restart
+        calls = _fake_run(monkeypatch, result=Mock(returncode=0, stderr=""))
 
-        schema_path.unlink()
-        config_path.unlink()
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "8080"},
+        )
 
         # Verify success without warning
         assert result["success"] is True
         assert "warning" not in result
 
         # Verify systemctl was called
-        mock_run.assert_called_once_with(
-            ["systemctl", "restart", "signalk.service"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        assert calls == [
+            (
+                (["systemctl", "restart", "signalk.service"],),
+                {"capture_output": True, "text": True, "timeout": 30},
+            )
+        ]
 
-    def test_set_config_restart_failure_returns_warning(self):
+    def test_set_config_restart_failure_returns_warning(
+        self, monkeypatch, port_schema, tmp_config_path
+    ):
         """Test that service restart failure returns warning."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ), patch("subprocess.run") as mock_run:
-            # Mock failed restart
-            mock_run.return_value = Mock(returncode=1, stderr="Service not found")
-
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "8080"},
-            )
+        _use_paths(monkeypatch, port_schema, tmp_config_path)
+        # Mock failed restart
+        _fake_run(monkeypatch, result=Mock(returncode=1, stderr="Service not found"))
 
-        schema_path.unlink()
-        config_path.unlink()
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "8080"},
+        )
 
         # Config should still be saved
         assert result["success"] is True
@@ -627,45 +275,53 @@ groups:
         assert "warning" in result
         assert "Service not found" in result["warning"]
 
-    def test_set_config_restart_timeout_returns_warning(self):
+    def test_set_config_restart_timeout_returns_warning(
+        self, monkeypatch, port_schema, tmp_config_path
+    ):
         """Test that service restart timeout returns warning."""
-        schema_content = """version: "1.0"
-groups:
-  - id: general
-    label: General Settings
-    fields:
-      - id: PORT
-        type: integer
-        label: Port
-"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".yml") as f:
-            f.write(schema_content)
-            f.flush()
-            schema_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".env") as f:
-            config_path = Path(f.name)
-
-        with patch(
-            "cockpit_container_apps.commands.set_config.get_config_schema_path",
-            return_value=schema_path,
-        ), patch(
-            "cockpit_container_apps.commands.set_config.get_config_file_path",
-            return_value=config_path,
-        ), patch("subprocess.run") as mock_run:
-            # Mock timeout
-            mock_run.side_effect = subprocess.TimeoutExpired("systemctl", 30)
-
-            result = set_config.execute(
-                package="signalk",
-                config={"PORT": "8080"},
-            )
+        _use_paths(monkeypatch, port_schema, tmp_config_path)
+        # Mock timeout
+        _fake_run(monkeypatch, error=subprocess.TimeoutExpired("systemctl", 30))
 
-        schema_path.unlink()
-        config_path.unlink()
+        result = set_config.execute(
+            package="signalk",
+            config={"PORT": "8080"},
+        )
 
         # Config should still be saved
         assert result["success"] is True
         # But with warning
         assert "warning" in result
         assert "timed out" in result["warning"]
+
+    def test_set_config_reuses_parsed_schema_until_modified(self, monkeypatch, tmp_path):
+        """Test that an unchanged schema is parsed once and an edited one is reloaded."""
+        # Written per test (not a shared fixture) because the test edits it
+        schema_path = tmp_path / "config.yml"
+        schema_path.write_text(PORT_SCHEMA)
+        _use_paths(monkeypatch, schema_path, tmp_path / "config.env")
+        _fake_run(monkeypatch, result=Mock(returncode=0, stderr=""))
+
+        loads = []
+        real_load = set_config.yaml.load
+
+        def counting_load(*args, **kwargs):
+            loads.append(args)
+            return real_load(*args, **kwargs)
+
+        monkeypatch.setattr(set_config.yaml, "load", counting_load)
+
+        first = set_config.execute(package="signalk", config={"PORT": "8080"})
+        second = set_config.execute(package="signalk", config={"PORT": "8081"})
+        assert len(loads) == 1
+
+        # Rewriting the schema changes its mtime and invalidates the cache
+        schema_path.write_text(schema_path.read_text().replace("PORT", "HTTP_PORT"))
+        stat = schema_path.stat()
+        os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        third = set_config.execute(package="signalk", config={"HTTP_PORT": "8082"})
+        assert len(loads) == 2
+
+        assert first["success"] is True
+        assert second["success"] is True
+        assert third["success"] is True
@@ -0,0 +1,79 @@
+"""
+Unit tests for store filter matching.
+"""
+
+from unittest.mock import patch
+
+from cockpit_container_apps.utils import optimized_apt
+from cockpit_container_apps.utils.store_config import StoreConfig, StoreFilter
+from cockpit_container_apps.utils.store_filter import matches_store_filter
+from tests.conftest import MockOrigin, MockPackage
+
+
+def _make_store(**filters) -> StoreConfig:
+    return StoreConfig(
+        id="marine",
+        name="Marine Apps",
+        description="Marine apps",
+        filters=StoreFilter(
+            include_origins=filters.get("include_origins", []),
+            include_sections=filters.get("include_sections", []),
+            include_tags=filters.get("include_tags", []),
+            include_packages=filters.get("include_packages", []),
+        ),
+    )
+
+
+def _make_package(name: str, origin: str, tags: str = "", section: str = "utils"):
+    pkg = MockPackage(name, section=section)
+    pkg.candidate.origins = (MockOrigin(origin, origin),)
+    pkg.candidate.record["Tag"] = tags
+    return pkg
+
+
+class TestMatchesStoreFilter:
+    """Tests for matches_store_filter."""
+
+    def test_matches_origin(self):
+        """Test that a package from an included origin matches."""
+        store = _make_store(include_origins=["Hat Labs"])
+        assert matches_store_filter(_make_package("signalk", "Hat Labs"), store)
+        assert not matches_store_filter(_make_package("bash", "Debian"), store)
+
+    def test_filter_types_are_ored(self):
+        """Test that matching any one filter type is enough."""
+        store = _make_store(include_origins=["Hat Labs"], include_tags=["field::marine"])
+        pkg = _make_package("opencpn", "Debian", tags="role::program, field::marine")
+        assert matches_store_filter(pkg, store)
+
+    def test_matches_section_and_package_name(self):
+        """Test section and explicit package filters."""
+        store = _make_store(include_sections=["net"], include_packages=["grafana"])
+        assert matches_store_filter(_make_package("nginx", "Debian", section="net"), store)
+        assert matches_store_filter(_make_package("grafana", "Debian"), store)
+        assert not matches_store_filter(_make_package("vim", "Debian"), store)
+
+    def test_tags_not_checked_after_cheaper_match(self):
+        """Test that tag matching is skipped once a cheaper filter matched."""
+        store = _make_store(include_origins=["Hat Labs"], include_tags=["field::marine"])
+
+        with patch(
+            "cockpit_container_apps.utils.store_filter._matches_tags_filter",
+            side_effect=AssertionError("tags should not be checked"),
+        ):
+            assert matches_store_filter(_make_package("signalk", "Hat Labs"), store)
+
+    def test_package_origin_read_once(self):
+        """Test that a package's origin is derived once across filter checks."""
+        store = _make_store(include_origins=["Hat Labs"])
+        other_store = _make_store(include_origins=["Debian"])
+        pkg = _make_package("signalk", "Hat Labs")
+
+        with patch(
+            "cockpit_container_apps.utils.optimized_apt._get_package_origin",
+            wraps=optimized_apt._get_package_origin,
+        ) as get_origin:
+            assert matches_store_filter(pkg, store)
+            assert not matches_store_filter(pkg, other_store)
+
+        assert get_origin.call_count == 1
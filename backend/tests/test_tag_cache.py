@@ -0,0 +1,152 @@
+"""
+Unit tests for debtag lookups.
+"""
+
+import types
+from unittest.mock import MagicMock, patch
+
+from cockpit_container_apps.utils.tag_cache import (
+    category_label,
+    get_facet_values,
+    get_tags,
+    iter_candidate_tags,
+    parse_tag_string,
+)
+from tests.conftest import MockCache, MockPackage
+
+
+class TestParseTagString:
+    """Tests for parse_tag_string."""
+
+    def test_splits_and_strips(self):
+        """Test that tags are split on commas with whitespace removed."""
+        tags = parse_tag_string("role::container-app, field::marine,category::navigation")
+        assert tags == frozenset({"role::container-app", "field::marine", "category::navigation"})
+
+    def test_ignores_empty_items_and_continuation_lines(self):
+        """Test that empty items and folded lines are handled."""
+        tags = parse_tag_string(" role::container-app ,,\n field::marine\n")
+        assert tags == frozenset({"role::container-app", "field::marine"})
+
+
+class TestGetTags:
+    """Tests for get_tags."""
+
+    def test_package_with_tags(self):
+        """Test reading tags from the candidate record."""
+        pkg = MockPackage("signalk-server")
+        pkg.candidate.record["Tag"] = "role::container-app, field::marine"
+        assert get_tags(pkg) == frozenset({"role::container-app", "field::marine"})
+
+    def test_package_without_tags(self):
+        """Test that a missing Tag field yields an empty set."""
+        assert get_tags(MockPackage("plain")) == frozenset()
+
+    def test_package_without_candidate(self):
+        """Test that a package without a candidate yields an empty set."""
+        pkg = MockPackage("gone")
+        pkg.candidate = None
+        assert get_tags(pkg) == frozenset()
+
+    def test_record_read_once_per_package(self):
+        """Test that the Tag record is not re-read for the same package."""
+        pkg = MockPackage("signalk-server")
+        pkg.candidate.record["Tag"] = "role::container-app"
+        assert get_tags(pkg) == frozenset({"role::container-app"})
+
+        pkg.candidate.record = {}
+        assert get_tags(pkg) == frozenset({"role::container-app"})
+
+
+class TestGetFacetValues:
+    """Tests for get_facet_values."""
+
+    def test_values_of_requested_facet(self):
+        """Test that values of the requested facet keep their Tag field order."""
+        pkg = MockPackage("signalk-server")
+        pkg.candidate.record["Tag"] = (
+            "category::navigation, role::container-app, category::monitoring, category::, "
+            "category::navigation"
+        )
+        assert get_facet_values(pkg, "category") == ("navigation", "monitoring")
+        assert get_facet_values(pkg, "role") == ("container-app",)
+        assert get_facet_values(pkg, "field") == ()
+
+
+class TestIterCandidateTags:
+    """Tests for iter_candidate_tags."""
+
+    def test_walks_packages_with_candidates(self):
+        """Test that every package with a candidate is yielded with its tags."""
+        tagged = MockPackage("signalk-server", installed=True)
+        tagged.candidate.record["Tag"] = "category::navigation"
+        untagged = MockPackage("plain")
+        gone = MockPackage("gone")
+        gone.candidate = None
+
+        assert list(iter_candidate_tags(MockCache([tagged, untagged, gone]))) == [
+            ("signalk-server", True, frozenset({"category::navigation"})),
+            ("plain", False, frozenset()),
+        ]
+
+    def test_walks_apt_pkg_cache(self):
+        """Test that an apt_pkg-backed cache is walked without apt.Package wrappers."""
+
+        class FakePkgCache:
+            def __init__(self, packages):
+                self.packages = packages
+
+        class FakeRecords:
+            def __init__(self, pkg_cache):
+                self.record = ""
+
+            def lookup(self, file_entry):
+                self.record = file_entry
+                return True
+
+        def make_pkg(name, record=None, installed=False, has_versions=True):
+            ver = types.SimpleNamespace(file_list=[record] if record is not None else [])
+            return types.SimpleNamespace(
+                name=name,
+                ver=ver,
+                has_versions=has_versions,
+                current_ver=ver if installed else None,
+                get_fullname=lambda pretty: name,
+            )
+
+        packages = [
+            make_pkg(
+                "signalk-server", "Package: signalk-server\nTag: category::navigation\n", True
+            ),
+            make_pkg("plain", "Package: plain\n"),
+            make_pkg("no-record"),
+            make_pkg("virtual", has_versions=False),
+        ]
+        apt_pkg = types.ModuleType("apt_pkg")
+        apt_pkg.Cache = FakePkgCache  # type: ignore[attr-defined]
+        apt_pkg.PackageRecords = FakeRecords  # type: ignore[attr-defined]
+        apt_pkg.TagSection = lambda text: dict(  # type: ignore[attr-defined]
+            line.split(": ", 1) for line in text.splitlines()
+        )
+
+        cache = MagicMock()
+        cache._cache = FakePkgCache(packages)
+        cache._depcache.get_candidate_ver = lambda pkg: pkg.ver
+
+        with patch.dict("sys.modules", {"apt_pkg": apt_pkg}):
+            result = list(iter_candidate_tags(cache))
+
+        cache.__iter__.assert_not_called()
+        assert result == [
+            ("signalk-server", True, frozenset({"category::navigation"})),
+            ("plain", False, frozenset()),
+            ("no-record", False, frozenset()),
+        ]
+
+
+class TestCategoryLabel:
+    """Tests for category_label."""
+
+    def test_derives_title_case_label(self):
+        """Test that labels are derived from the category ID."""
+        assert category_label("navigation") == "Navigation"
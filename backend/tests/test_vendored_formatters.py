@@ -6,11 +6,14 @@ Note: formatters are now in utils/ (forked from cockpit-apt).
 """
 
 import json
+from unittest.mock import patch
 
 from cockpit_container_apps.utils.formatters import (
     format_package,
     format_package_details,
     to_json,
+    to_json_bytes,
+    to_json_line,
 )
 
 
@@ -30,6 +33,39 @@ class TestToJson:
         parsed = json.loads(result)
         assert parsed == [1, 2, 3]
 
+    def test_unicode_not_escaped(self):
+        """Test that non-ASCII characters are emitted as-is."""
+        result = to_json({"name": "Sää"})
+        assert "Sää" in result
+
+    def test_fallback_without_orjson(self):
+        """Test that the stdlib encoder produces the same document."""
+        data = {"name": "test", "tags": ["a", "b"], "count": 2, "icon": None}
+
+        with patch("cockpit_container_apps.utils.formatters.orjson", None):
+            fallback = to_json(data)
+
+        assert json.loads(fallback) == json.loads(to_json(data))
+
+    def test_json_bytes_match_text_output(self):
+        """Test that the bytes form is the UTF-8 encoding of to_json."""
+        data = {"name": "Sää", "categories": ["navigation"]}
+
+        assert to_json_bytes(data) == to_json(data).encode()
+        with patch("cockpit_container_apps.utils.formatters.orjson", None):
+            assert to_json_bytes(data) == to_json(data).encode()
+
+    def test_json_line_is_single_line(self):
+        """Test that streamed JSON lines contain no newlines in either encoder."""
+        data = {"type": "progress", "percentage": 50, "message": "Sää\nsetup"}
+
+        with patch("cockpit_container_apps.utils.formatters.orjson", None):
+            fallback = to_json_line(data)
+
+        for line in (to_json_line(data), fallback):
+            assert "\n" not in line
+            assert json.loads(line) == data
+
 
 class TestFormatPackage:
     """Tests for the format_package function."""
@@ -62,6 +98,24 @@ class TestFormatPackage:
         # Should indicate upgradable status
         assert "upgradable" in result or "installed" in result
 
+    def test_format_package_categories(self, mock_apt_package):
+        """Test that category:: tags are listed as categories in Tag field order."""
+        mock_apt_package.candidate.record["Tag"] = (
+            "role::container-app, category::navigation, category::monitoring"
+        )
+        result = format_package(mock_apt_package)
+
+        assert result["categories"] == ["navigation", "monitoring"]
+
+    def test_format_package_categories_are_not_sorted(self, mock_apt_package):
+        """Test that categories are not reordered and repeated tags are listed once."""
+        mock_apt_package.candidate.record["Tag"] = (
+            "category::weather, role::container-app, category::ais, category::weather"
+        )
+        result = format_package(mock_apt_package)
+
+        assert result["categories"] == ["weather", "ais"]
+
 
 class TestFormatPackageDetails:
     """Tests for the format_package_details function."""
@@ -83,3 +137,14 @@ class TestFormatPackageDetails:
 
         # Should have size information
         assert "size" in result or "installedSize" in result
+
+    def test_format_detailed_without_candidate(self, mock_apt_package):
+        """Test that a package without a candidate gets default detail fields."""
+        mock_apt_package.candidate = None
+        result = format_package_details(mock_apt_package)
+
+        assert result["priority"] == "optional"
+        assert result["maintainer"] == ""
+        assert result["size"] == 0
+        assert result["installedSize"] == 0
+        assert result["dependencies"] == []
@@ -4,6 +4,8 @@ Tests for vendored store configuration utilities.
 Verifies that store configuration loading works correctly.
 """
 
+import dataclasses
+import os
 import tempfile
 from pathlib import Path
 
@@ -13,8 +15,10 @@ import yaml
 from cockpit_container_apps.utils.store_config import (
     StoreConfig,
     StoreFilter,
+    _parse_store_dict,
     load_stores,
 )
+from cockpit_container_apps.vendor.cockpit_apt_utils.errors import APTBridgeError
 
 
 class TestLoadStores:
@@ -71,6 +75,71 @@ class TestLoadStores:
             stores = load_stores(Path(tmpdir))
             assert len(stores) == 3
 
+    def test_load_only_yaml_files(self, tmp_path):
+        """Test that .yaml and .yml files are loaded in name order, other entries skipped."""
+        for name, store_id in (("b.yml", "store-b"), ("a.yaml", "store-a")):
+            (tmp_path / name).write_text(
+                yaml.dump(
+                    {
+                        "id": store_id,
+                        "name": store_id,
+                        "description": "A test store",
+                        "filters": {"include_origins": ["Test Origin"]},
+                    }
+                )
+            )
+        (tmp_path / "notes.txt").write_text("not a store")
+        (tmp_path / "dir.yaml").mkdir()
+
+        assert [store.id for store in load_stores(tmp_path)] == ["store-a", "store-b"]
+
+    def test_scalar_filter_value_is_skipped(self, tmp_path):
+        """Test that a store whose filter is not a list is skipped, not fatal."""
+        for store_id, filters in (
+            ("good", {"include_packages": ["signalk-server"]}),
+            ("bad", {"include_packages": 42}),
+        ):
+            (tmp_path / f"{store_id}.yaml").write_text(
+                yaml.dump(
+                    {
+                        "id": store_id,
+                        "name": store_id,
+                        "description": "A test store",
+                        "filters": filters,
+                    }
+                )
+            )
+
+        assert [store.id for store in load_stores(tmp_path)] == ["good"]
+
+    def test_unchanged_store_file_is_not_reparsed(self, tmp_path):
+        """Test that an unchanged file yields the same parsed config until edited."""
+        store_path = tmp_path / "test-store.yaml"
+        store_path.write_text(
+            yaml.dump(
+                {
+                    "id": "test-store",
+                    "name": "Test Store",
+                    "description": "A test store",
+                    "filters": {"include_origins": ["Test Origin"]},
+                }
+            )
+        )
+
+        first = load_stores(tmp_path)
+        assert load_stores(tmp_path)[0] is first[0]
+
+        store_path.write_text(store_path.read_text().replace("Test Store", "Renamed Store"))
+        stat = store_path.stat()
+        os.utime(store_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert load_stores(tmp_path)[0].name == "Renamed Store"
+
+        # A rewrite within the same timestamp is caught by the size change
+        stat = store_path.stat()
+        store_path.write_text(store_path.read_text().replace("Renamed Store", "Store"))
+        os.utime(store_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert load_stores(tmp_path)[0].name == "Store"
+
 
 class TestStoreFilter:
     """Tests for the StoreFilter class."""
@@ -95,6 +164,19 @@ class TestStoreFilter:
         )
         assert "role::container-app" in store_filter.include_tags
 
+    def test_store_filter_is_immutable(self):
+        """Test that filter lists are stored as tuples and cannot be reassigned."""
+        store_filter = StoreFilter(
+            include_origins=["Hat Labs"],
+            include_sections=[],
+            include_tags=[],
+            include_packages=[],
+        )
+        assert store_filter.include_origins == ("Hat Labs",)
+        assert store_filter.include_sections == ()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            store_filter.include_origins = ("Debian",)  # type: ignore[misc]
+
     def test_store_filter_requires_at_least_one_criterion(self):
         """Test that filter requires at least one filter criterion."""
         with pytest.raises(ValueError):
@@ -162,3 +244,36 @@ class TestStoreConfig:
                 description="Test",
                 filters=filters,
             )
+
+
+class TestParseStoreDict:
+    """Tests for building store configs from parsed YAML data."""
+
+    def test_parse_full_store(self):
+        """Test that all store fields and category metadata are parsed."""
+        store = _parse_store_dict(
+            {
+                "id": "marine-apps",
+                "name": "Marine Apps",
+                "description": "Container apps for marine vessels",
+                "icon": "anchor",
+                "filters": {"include_tags": ["field::marine"]},
+                "category_metadata": [
+                    {"id": "navigation", "label": "Navigation & Charts"},
+                    {"id": "missing-label"},
+                    "not-a-mapping",
+                ],
+            },
+            Path("marine-apps.yaml"),
+        )
+
+        assert store.filters.include_tags == ("field::marine",)
+        assert store.filters.include_origins == ()
+        assert store.icon == "anchor"
+        assert store.category_metadata is not None
+        assert [meta.id for meta in store.category_metadata] == ["navigation"]
+
+    def test_parse_missing_required_fields(self):
+        """Test that missing required fields are reported."""
+        with pytest.raises(APTBridgeError, match="description, filters"):
+            _parse_store_dict({"id": "marine-apps", "name": "Marine Apps"}, Path("x.yaml"))